@@ -1,4 +1,10 @@
 import os
+import time
+
+# Measured from here so the startup report covers importing every router
+_startup_begin = time.perf_counter()
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -9,8 +15,31 @@ from routes.bets import router as bets_router
 from routes.pinned_games import router as pinned_games_router
 from routes.teams import router as teams_router
 from routes.account import router as account_router
+from routes.bootstrap import router as bootstrap_router
+from routes.teams import start_teams_catalog_refresher
+from routes.pinned_games import start_pinned_games_sweeper
+from briefing import background, cache_snapshot
+from briefing.settlement import start_settlement_job
+from routes.responses import CompressionMiddleware, FastJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    print(f"[Startup] Routes imported in {_startup_import_ms:.0f} ms, "
+          f"ready to serve in {(time.perf_counter() - _startup_begin) * 1000:.0f} ms")
+    # Restore caches saved before the machine was last stopped, then top up whatever is missing or stale
+    cache_snapshot.load_snapshot()
+    # Warm the teams catalog in the background so the first search after a cold start is served from memory
+    start_teams_catalog_refresher()
+    cache_snapshot.start_snapshot_writer()
+    start_settlement_job()
+    start_pinned_games_sweeper()
+    yield
+    background.stop_all()
+    cache_snapshot.save_snapshot()
 
-app = FastAPI(title="Briefing API")
+
+app = FastAPI(title="Briefing API", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 # Enable CORS
 # Get additional origins from environment variable
@@ -23,6 +52,9 @@ allowed_origins = [
 
 print(f"CORS allowed origins: {allowed_origins}")
 
+# MessagePack negotiation and brotli/gzip compression of JSON responses
+app.add_middleware(CompressionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -44,3 +76,6 @@ app.include_router(bets_router)
 app.include_router(pinned_games_router)
 app.include_router(teams_router)
 app.include_router(account_router)
+app.include_router(bootstrap_router)
+
+_startup_import_ms = (time.perf_counter() - _startup_begin) * 1000
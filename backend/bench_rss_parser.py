@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming RSS parser against the previous feedparser path.
+
+Usage:
+    python bench_rss_parser.py                  # synthetic 300-item feed
+    python bench_rss_parser.py --items 1000     # bigger synthetic feed
+    python bench_rss_parser.py --source nytimes # download a real feed once, then benchmark it
+"""
+import re
+import time
+import argparse
+
+import feedparser
+import requests
+
+from briefing.news_fetcher import NewsFetcher
+from briefing.rss_parser import clean_summary, parse_feed
+
+
+def synthetic_feed(count: int) -> bytes:
+    items = ''.join(
+        f"<item><title>Story {i}: something happened somewhere</title>"
+        f"<link>https://example.com/news/{i}</link><guid>https://example.com/news/{i}</guid>"
+        f"<description><![CDATA[<p>Paragraph with <a href='https://example.com/{i}'>a link</a> "
+        f"and <b>bold</b> text. {'Lorem ipsum dolor sit amet. ' * 8}</p>]]></description>"
+        f"<pubDate>Mon, 06 Jan 2025 10:{i % 60:02d}:00 GMT</pubDate></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Bench</title>{items}</channel></rss>'.encode()
+
+
+def legacy_parse(content: bytes, limit: int):
+    """What NewsFetcher.fetch_feed did before: full feedparser parse, then per-item re.sub."""
+    feed = feedparser.parse(content)
+    items = []
+    for entry in feed.entries[:limit]:
+        summary = re.sub('<[^<]+?>', '', entry.get('summary', entry.get('description', '')))
+        summary = ' '.join(summary.split())
+        items.append((entry.get('title'), summary[:200], entry.get('link')))
+    return items
+
+
+def streaming_parse(content: bytes, limit: int):
+    chunks = (content[i:i + 16384] for i in range(0, len(content), 16384))
+    return [(item['title'], clean_summary(item['summary']), item['link']) for item in parse_feed(chunks, limit)]
+
+
+def bench(name: str, fn, content: bytes, limit: int, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(content, limit)
+    per_call = (time.perf_counter() - start) / iterations * 1000
+    print(f"{name:10} {per_call:8.2f} ms/feed")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark RSS parsing')
+    parser.add_argument('--items', type=int, default=300, help='Items in the synthetic feed')
+    parser.add_argument('--source', help='Benchmark a real feed instead (source name or URL)')
+    parser.add_argument('--limit', type=int, default=10, help='Items kept per feed')
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.source:
+        url = NewsFetcher.DEFAULT_FEEDS.get(args.source.lower(), args.source)
+        content = requests.get(url, timeout=10).content
+    else:
+        content = synthetic_feed(args.items)
+    print(f"Feed size: {len(content) / 1024:.0f} KiB, keeping {args.limit} items, {args.iterations} iterations")
+
+    legacy = bench('feedparser', legacy_parse, content, args.limit, args.iterations)
+    streaming = bench('streaming', streaming_parse, content, args.limit, args.iterations)
+    print(f"Speedup: {legacy / streaming:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Background task helpers for the API server.
+
+Tasks run on daemon threads so a stuck upstream request can never keep the
+process alive, and all periodic tasks share one stop event that the app's
+shutdown hook sets.
+"""
+
+import time
+import threading
+import traceback
+from typing import Callable, Dict
+
+_stop_event = threading.Event()
+_tasks: Dict[str, threading.Thread] = {}
+_tasks_lock = threading.Lock()
+
+
+def run_in_background(name: str, fn: Callable[[], None]) -> bool:
+    """
+    Run fn once on a daemon thread.
+
+    Args:
+        name: Task name; a task with the same name that is still running is not started twice
+        fn: Callable with no arguments
+
+    Returns:
+        True if the task was started, False if it was already running
+    """
+    with _tasks_lock:
+        existing = _tasks.get(name)
+        if existing and existing.is_alive():
+            return False
+
+        def run():
+            try:
+                fn()
+            except Exception as e:
+                print(f"[Background] Task {name} failed: {e}")
+                traceback.print_exc()
+            finally:
+                # Drop finished tasks so per-user task names don't accumulate
+                with _tasks_lock:
+                    if _tasks.get(name) is thread:
+                        del _tasks[name]
+
+        thread = threading.Thread(target=run, name=name, daemon=True)
+        _tasks[name] = thread
+        thread.start()
+        return True
+
+
+def run_periodically(name: str, interval: float, fn: Callable[[], None], initial_delay: float = 0.0) -> bool:
+    """
+    Run fn every `interval` seconds on a daemon thread until stop_all() is called.
+
+    Args:
+        name: Task name (periodic tasks are started at most once)
+        interval: Seconds between the end of one run and the start of the next
+        fn: Callable with no arguments; exceptions are logged and the loop continues
+        initial_delay: Seconds to wait before the first run
+
+    Returns:
+        True if the task was started, False if it was already running
+    """
+    def loop():
+        if _stop_event.wait(initial_delay):
+            return
+        while True:
+            try:
+                fn()
+            except Exception as e:
+                print(f"[Background] Periodic task {name} failed: {e}")
+                traceback.print_exc()
+            if _stop_event.wait(interval):
+                return
+
+    return run_in_background(name, loop)
+
+
+def stop_all(timeout: float = 5.0):
+    """Signal all periodic tasks to stop and wait up to `timeout` seconds in total for them."""
+    _stop_event.set()
+    with _tasks_lock:
+        threads = list(_tasks.values())
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
@@ -2,12 +2,41 @@
 Base sports fetcher module for retrieving data from ESPN public APIs.
 """
 
+import time
 import requests
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from dateutil import parser
+from . import cache_snapshot
+from .cache import TieredCache
+from .final_store import get_final, put_final
+from .search_index import get_search_index
+
+# Summaries of finished games no longer change, so they are kept across requests
+_FINISHED_SUMMARY_CACHE_TTL = 86400  # 24 hours in seconds
+_FINISHED_SUMMARY_CACHE_SIZE = 50  # summaries are large, keep only the most recent ones locally
+_finished_summary_cache = TieredCache(
+    'finished_summaries', _FINISHED_SUMMARY_CACHE_TTL, max_entries=_FINISHED_SUMMARY_CACHE_SIZE
+)  # {'sport_path:event_id': {'data': {...}, 'timestamp': float}}
+
+# League calendars (ESPN scoreboard calendars, F1 season schedule)
+_CALENDAR_CACHE_TTL = 43200  # 12 hours in seconds
+_calendar_cache = TieredCache('calendars', _CALENDAR_CACHE_TTL)  # {'sport_path' | 'f1:season': {'data': ..., 'timestamp': float}}
+
+# ESPN news per sport, shared by /api/sports/news and the merged news feed
+_NEWS_CACHE_TTL = 300  # 5 minutes in seconds
+_NEWS_FETCH_LIMIT = 50  # articles requested from ESPN per sport; callers slice to their limit
+_news_cache = TieredCache('sports_news', _NEWS_CACHE_TTL)  # {sport: {'data': [...], 'timestamp': float}}
+
+# Parts of a summary still read once the game is final; the rest (plays, drives,
+# win probability, news, odds...) only feeds live views and derived '_' fields
+_FINAL_SUMMARY_KEYS = ('header', 'boxscore', 'rosters', 'scoringPlays')
+
+cache_snapshot.register('finished_summaries', _finished_summary_cache, _FINISHED_SUMMARY_CACHE_TTL)
+cache_snapshot.register('calendars', _calendar_cache, _CALENDAR_CACHE_TTL)
+cache_snapshot.register('sports_news', _news_cache, _NEWS_CACHE_TTL)
+
 
 class BaseSportsFetcher:
     """Base class for fetching sports scores and news from ESPN public JSON endpoints."""
@@ -72,6 +101,40 @@ class BaseSportsFetcher:
         session.mount('https://', adapter)
         return session
 
+    def _get_finished_summary(self, sport_path: str, event_id: str) -> Optional[Dict]:
+        """Return the summary of a finished game from memory or the permanent store, if any."""
+        cache_key = f"{sport_path}:{event_id}"
+        cache_entry = _finished_summary_cache.get(cache_key)
+        if cache_entry and (time.time() - cache_entry['timestamp']) < _FINISHED_SUMMARY_CACHE_TTL:
+            return cache_entry['data']
+
+        data = get_final(sport_path, event_id)
+        if data is not None:
+            _finished_summary_cache[cache_key] = {'data': data, 'timestamp': time.time()}
+        return data
+
+    def _store_finished_summary(self, sport_path: str, event_id: str, data: Dict) -> Dict:
+        """
+        Keep the summary of a finished game in memory and in the permanent store.
+
+        Returns:
+            The compact summary that was stored
+        """
+        compact = {key: value for key, value in data.items() if key in _FINAL_SUMMARY_KEYS or key.startswith('_')}
+        _finished_summary_cache[f"{sport_path}:{event_id}"] = {'data': compact, 'timestamp': time.time()}
+        put_final(sport_path, event_id, compact)
+        return compact
+
+    def _get_cached_calendar(self, cache_key: str) -> Optional[Any]:
+        """Return a cached league calendar if it is still fresh."""
+        cache_entry = _calendar_cache.get(cache_key)
+        if cache_entry and (time.time() - cache_entry['timestamp']) < _CALENDAR_CACHE_TTL:
+            return cache_entry['data']
+        return None
+
+    def _store_calendar(self, cache_key: str, calendar: Any):
+        _calendar_cache[cache_key] = {'data': calendar, 'timestamp': time.time()}
+
     def fetch_scores(self, sport: str, limit: int = 10, date: Optional[str] = None) -> List[Dict]:
         """
         Fetch recent scores for a specific sport.
@@ -317,6 +380,9 @@ class BaseSportsFetcher:
         """
         Fetch recent news for a specific sport.
 
+        Articles are cached per sport for 5 minutes; if ESPN fails, the last
+        cached articles are returned instead of raising.
+
         Args:
             sport: Sport name (e.g., 'nfl', 'nba', 'mlb')
             limit: Maximum number of news items to return
@@ -328,7 +394,11 @@ class BaseSportsFetcher:
         if not sport_path:
             raise ValueError(f"Unknown sport: {sport}. Available: {', '.join(self.SPORTS.keys())}")
 
-        url = f"{self.BASE_URL}/{sport_path}/news"
+        cache_entry = _news_cache.get(sport.lower())
+        if cache_entry and (time.time() - cache_entry['timestamp']) < _NEWS_CACHE_TTL:
+            return cache_entry['data'][:limit]
+
+        url = f"{self.BASE_URL}/{sport_path}/news?limit={_NEWS_FETCH_LIMIT}"
 
         try:
             response = self.session.get(url, timeout=self.timeout)
@@ -336,7 +406,7 @@ class BaseSportsFetcher:
             data = response.json()
 
             news_items = []
-            articles = data.get('articles', [])[:limit]
+            articles = data.get('articles', [])[:_NEWS_FETCH_LIMIT]
 
             for article in articles:
                 news_item = {
@@ -347,13 +417,28 @@ class BaseSportsFetcher:
                 }
                 news_items.append(news_item)
 
-            return news_items
+            _news_cache[sport.lower()] = {'data': news_items, 'timestamp': time.time()}
+            self._index_news(sport.lower(), news_items)
+            return news_items[:limit]
 
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Error fetching {sport} news: {str(e)}")
         except Exception as e:
+            if cache_entry:
+                print(f"[Cache] Serving stale {sport} news after fetch error: {e}")
+                return cache_entry['data'][:limit]
+            if isinstance(e, requests.exceptions.RequestException):
+                raise Exception(f"Error fetching {sport} news: {str(e)}")
             raise Exception(f"Error parsing {sport} news: {str(e)}")
 
+    @staticmethod
+    def _index_news(sport: str, news_items: List[Dict]):
+        """Add ESPN news items to the news search index under source 'espn-<sport>'."""
+        index = get_search_index()
+        for item in news_items:
+            index.add(
+                item['link'] or f"espn-{sport}:{item['title']}", item['title'], item['description'],
+                link=item['link'], published=item['published'], source=f"espn-{sport}",
+            )
+
     def fetch_schedule(self, sport: str, limit: int = 10, date: Optional[str] = None) -> List[Dict]:
         """
         Fetch upcoming games schedule for a specific sport.
@@ -406,8 +491,12 @@ class BaseSportsFetcher:
 
             # If no upcoming games in current scoreboard, try fetching future dates
             if not games:
-                # Get calendar dates from the API response
+                # Get calendar dates from the API response, or the last calendar seen for this league
                 calendar = data.get('leagues', [{}])[0].get('calendar', []) if data.get('leagues') else []
+                if calendar:
+                    self._store_calendar(sport_path, calendar)
+                else:
+                    calendar = self._get_cached_calendar(sport_path) or []
                 
                 # Strategy 1: Try to use the calendar provided by ESPN
                 if calendar:
@@ -667,6 +756,10 @@ class BaseSportsFetcher:
 
         url = f"{self.BASE_URL}/{sport_path}/summary?event={event_id}"
 
+        cached = self._get_finished_summary(sport_path, event_id)
+        if cached is not None:
+            return cached
+
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
@@ -705,6 +798,8 @@ class BaseSportsFetcher:
                 # ESPN usually returns EST.
                 if status_detail and (" PM " in status_detail or " AM " in status_detail) and (" EST" in status_detail or " EDT" in status_detail):
                     try:
+                        from dateutil import parser
+
                         # Extract the time part
                         # Typical format: "11/25 - 8:00 PM EST" or "Mon, November 25 - 8:00 PM EST"
                         # Simple string replacement for EST->PST calculation (-3 hours)
@@ -893,6 +988,9 @@ class BaseSportsFetcher:
             except Exception:
                 pass
 
+            if state == "post":
+                self._store_finished_summary(sport_path, event_id, data)
+
             return data
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error fetching {sport} summary for event {event_id}: {str(e)}")
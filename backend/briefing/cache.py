@@ -0,0 +1,264 @@
+"""
+Two-tier caches shared by the fetchers and routes.
+
+Every cache keeps a local in-process LRU (L1). When BRIEFING_CACHE_BACKEND is
+'sqlite' or 'redis', entries are also written to a shared L2, so uvicorn
+workers on one machine (sqlite) or all machines (redis) reuse each other's
+upstream fetches instead of each warming a private copy.
+
+Entries keep the shape used throughout the app: {'data': ..., 'timestamp': float}.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_SHARED_RETRY_INTERVAL = 30  # seconds to skip L2 after it failed
+_SQLITE_PURGE_EVERY = 500  # writes between purges of expired rows
+
+
+def cache_dir() -> Path:
+    """Local cache directory, configurable with BRIEFING_CACHE_DIR (default ~/.cache/briefing)."""
+    return Path(os.getenv('BRIEFING_CACHE_DIR') or os.path.join(Path.home(), '.cache', 'briefing'))
+
+
+class CacheBackend(ABC):
+    """Key/value store for cache entries. Keys are strings, entries are JSON-serializable dicts."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: Dict, ttl: float):
+        ...
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU.
+
+    The TTL is not enforced here: expired entries stay until evicted so callers
+    can still fall back to stale data when an upstream refresh fails.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict, ttl: float = 0):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def items(self) -> List[Tuple[str, Dict]]:
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteBackend(CacheBackend):
+    """On-disk store shared by all worker processes on one machine."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries "
+                "(key TEXT PRIMARY KEY, entry TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, so keep one per thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=2)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT entry FROM cache_entries WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, entry: Dict, ttl: float):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, entry, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(entry), now + ttl),
+            )
+            self._writes += 1
+            if self._writes % _SQLITE_PURGE_EVERY == 0:
+                conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+
+    def delete(self, key: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+
+class RedisBackend(CacheBackend):
+    """Store shared by every machine, for any Redis-compatible server (Redis, Valkey, Upstash...)."""
+
+    def __init__(self, url: str):
+        import redis  # optional dependency, only needed when this backend is configured
+
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key: str) -> Optional[Dict]:
+        raw = self._client.get(key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, entry: Dict, ttl: float):
+        self._client.set(key, json.dumps(entry), ex=max(1, int(ttl)))
+
+    def delete(self, key: str):
+        self._client.delete(key)
+
+
+_shared_backend: Optional[CacheBackend] = None
+_shared_backend_loaded = False
+_shared_backend_lock = threading.Lock()
+_shared_retry_at = 0.0
+
+
+def get_shared_backend() -> Optional[CacheBackend]:
+    """
+    Get the shared L2 backend configured by the environment, created on first use.
+
+    BRIEFING_CACHE_BACKEND: 'memory' (default, no L2), 'sqlite' or 'redis'
+    BRIEFING_CACHE_URL: SQLite file path (default <BRIEFING_CACHE_DIR>/cache.sqlite3)
+        or Redis URL (default REDIS_URL)
+    """
+    global _shared_backend, _shared_backend_loaded
+    if not _shared_backend_loaded:
+        with _shared_backend_lock:
+            if not _shared_backend_loaded:
+                backend_name = os.getenv('BRIEFING_CACHE_BACKEND', 'memory').lower()
+                url = os.getenv('BRIEFING_CACHE_URL')
+                try:
+                    if backend_name == 'sqlite':
+                        _shared_backend = SQLiteBackend(Path(url) if url else cache_dir() / 'cache.sqlite3')
+                    elif backend_name == 'redis':
+                        url = url or os.getenv('REDIS_URL')
+                        if not url:
+                            raise ValueError("BRIEFING_CACHE_URL or REDIS_URL must be set for the redis backend")
+                        _shared_backend = RedisBackend(url)
+                    elif backend_name != 'memory':
+                        raise ValueError(f"Unknown cache backend: {backend_name}")
+                except Exception as e:
+                    print(f"[Cache] Shared cache backend unavailable, using in-process caches only: {e}")
+                    _shared_backend = None
+                if _shared_backend:
+                    print(f"[Cache] Using shared {backend_name} cache backend")
+                _shared_backend_loaded = True
+    return _shared_backend
+
+
+def _call_shared(method: str, *args):
+    """Call the shared backend, backing off for a while after it fails."""
+    global _shared_retry_at
+    backend = get_shared_backend()
+    if backend is None or time.time() < _shared_retry_at:
+        return None
+    try:
+        return getattr(backend, method)(*args)
+    except Exception as e:
+        _shared_retry_at = time.time() + _SHARED_RETRY_INTERVAL
+        print(f"[Cache] Shared cache {method} failed, skipping it for {_SHARED_RETRY_INTERVAL}s: {e}")
+        return None
+
+
+class TieredCache:
+    """
+    Cache of {'data': ..., 'timestamp': float} entries with a local L1 and an optional shared L2.
+
+    Behaves like the plain dict caches it replaces: get() returns the entry
+    (fresh or stale) and callers compare its timestamp against the TTL. When
+    the local entry is missing or expired, the shared tier is consulted, so
+    another worker's refresh is picked up instead of refetching upstream.
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int = 1024):
+        self.name = name
+        self.ttl = ttl
+        self._local = MemoryBackend(max_entries)
+
+    def _shared_key(self, key: str) -> str:
+        return f"briefing:{self.name}:{key}"
+
+    def get(self, key: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        entry = self._local.get(key)
+        if entry is None or time.time() - entry['timestamp'] >= self.ttl:
+            shared_entry = _call_shared('get', self._shared_key(key))
+            if shared_entry and (entry is None or shared_entry['timestamp'] > entry['timestamp']):
+                self._local.set(key, shared_entry)
+                entry = shared_entry
+        return entry if entry is not None else default
+
+    def __getitem__(self, key: str) -> Dict:
+        entry = self.get(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry
+
+    def __setitem__(self, key: str, entry: Dict):
+        self._local.set(key, entry)
+        remaining = self.ttl - (time.time() - entry['timestamp'])
+        if remaining > 0:
+            _call_shared('set', self._shared_key(key), entry, remaining)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def pop(self, key: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        entry = self._local.get(key)
+        self._local.delete(key)
+        _call_shared('delete', self._shared_key(key))
+        return entry if entry is not None else default
+
+    def items(self) -> List[Tuple[str, Dict]]:
+        """Entries held locally (the shared tier is not enumerated)."""
+        return self._local.items()
+
+    def clear(self):
+        """Drop local entries; the shared tier expires on its own."""
+        self._local.clear()
+
+    def __len__(self) -> int:
+        return len(self._local)
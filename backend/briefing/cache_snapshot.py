@@ -0,0 +1,141 @@
+"""
+Snapshot warm in-memory caches to local disk and restore them on startup.
+
+Fly stops idle machines, so without a snapshot every wake starts with empty
+caches. Modules register their TieredCaches together with their TTL; entries
+are saved with their original timestamps and only restored while still fresh.
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional
+
+from . import background
+from .cache import TieredCache, cache_dir
+
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_FILE = "cache_snapshot.json"
+_SNAPSHOT_INTERVAL = 600  # 10 minutes in seconds
+
+
+class _RegisteredCache(NamedTuple):
+    cache: TieredCache
+    ttl: float
+    on_load: Optional[Callable[[], None]]
+
+
+_registry: Dict[str, _RegisteredCache] = {}
+_save_lock = threading.Lock()
+
+
+def register(name: str, cache: TieredCache, ttl: float, on_load: Optional[Callable[[], None]] = None):
+    """
+    Include a cache in snapshots.
+
+    Args:
+        name: Stable name used as the key in the snapshot file
+        cache: Cache of {'data': ..., 'timestamp': float} entries
+        ttl: Seconds an entry stays fresh; older entries are neither saved nor restored
+        on_load: Called after entries were restored (e.g. to rebuild a derived index)
+    """
+    _registry[name] = _RegisteredCache(cache, ttl, on_load)
+
+
+def snapshot_path() -> Path:
+    """Snapshot location inside the local cache directory (BRIEFING_CACHE_DIR)."""
+    return cache_dir() / _SNAPSHOT_FILE
+
+
+def save_snapshot(path: Optional[Path] = None) -> int:
+    """
+    Write all fresh entries of the registered caches to disk.
+
+    The file is written to a temporary path and renamed, so a crash mid-write
+    never leaves a truncated snapshot behind.
+
+    Returns:
+        Number of entries written
+    """
+    path = path or snapshot_path()
+    now = time.time()
+    caches = {}
+    count = 0
+    for name, registered in list(_registry.items()):
+        entries = {
+            key: entry
+            for key, entry in list(registered.cache.items())
+            if entry and now - entry.get('timestamp', 0) < registered.ttl
+        }
+        caches[name] = entries
+        count += len(entries)
+
+    with _save_lock:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process temp file: every uvicorn worker writes its own snapshot
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': _SNAPSHOT_VERSION, 'saved_at': now, 'caches': caches}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[Cache] Failed to write snapshot to {path}: {e}")
+            return 0
+
+    print(f"[Cache] Saved {count} cache entries to {path}")
+    return count
+
+
+def load_snapshot(path: Optional[Path] = None) -> int:
+    """
+    Restore fresh entries from the snapshot into the registered caches.
+
+    Entries past their TTL are dropped, and entries already in memory that are
+    newer than the snapshot are kept.
+
+    Returns:
+        Number of entries restored
+    """
+    path = path or snapshot_path()
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"[Cache] Ignoring unreadable snapshot {path}: {e}")
+        return 0
+
+    if snapshot.get('version') != _SNAPSHOT_VERSION:
+        print(f"[Cache] Ignoring snapshot {path} with version {snapshot.get('version')}")
+        return 0
+
+    now = time.time()
+    count = 0
+    for name, entries in snapshot.get('caches', {}).items():
+        registered = _registry.get(name)
+        if not registered or not isinstance(entries, dict):
+            continue
+        restored = 0
+        for key, entry in entries.items():
+            timestamp = entry.get('timestamp', 0) if isinstance(entry, dict) else 0
+            if now - timestamp >= registered.ttl:
+                continue
+            current = registered.cache.get(key)
+            if current and current.get('timestamp', 0) >= timestamp:
+                continue
+            registered.cache[key] = {'data': entry.get('data'), 'timestamp': timestamp}
+            restored += 1
+        if restored and registered.on_load:
+            registered.on_load()
+        count += restored
+
+    print(f"[Cache] Restored {count} cache entries from {path}")
+    return count
+
+
+def start_snapshot_writer():
+    """Save a snapshot every 10 minutes so a hard stop loses at most that much warmth."""
+    background.run_periodically('cache-snapshot', _SNAPSHOT_INTERVAL, save_snapshot, initial_delay=_SNAPSHOT_INTERVAL)
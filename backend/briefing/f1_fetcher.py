@@ -4,6 +4,7 @@ F1 specific fetcher logic.
 
 import requests
 from typing import List, Dict, Optional, Any
+from .final_store import get_final, put_final
 
 class F1FetcherMixin:
     """Mixin for F1 specific fetcher logic."""
@@ -65,10 +66,14 @@ class F1FetcherMixin:
         """
         try:
             # First, fetch the full schedule (2025 season)
-            schedule_url = "http://api.jolpi.ca/ergast/f1/2025.json"
-            schedule_response = self.session.get(schedule_url, timeout=self.timeout)
-            schedule_response.raise_for_status()
-            schedule_data = schedule_response.json()
+            # The season calendar rarely changes, so it is cached by BaseSportsFetcher
+            schedule_data = self._get_cached_calendar('f1:2025')
+            if schedule_data is None:
+                schedule_url = "http://api.jolpi.ca/ergast/f1/2025.json"
+                schedule_response = self.session.get(schedule_url, timeout=self.timeout)
+                schedule_response.raise_for_status()
+                schedule_data = schedule_response.json()
+                self._store_calendar('f1:2025', schedule_data)
 
             # Then, fetch the results to get winners
             results_url = "http://api.jolpi.ca/ergast/f1/2025/results/1.json"
@@ -152,6 +157,11 @@ class F1FetcherMixin:
         Returns:
             Dict with race info and full results (all positions)
         """
+        # Results of a finished race never change
+        stored = get_final('f1', f"2025:{round_number}")
+        if stored is not None:
+            return stored
+
         try:
             # Fetch race results for specific round
             url = f"http://api.jolpi.ca/ergast/f1/2025/{round_number}/results.json"
@@ -197,7 +207,7 @@ class F1FetcherMixin:
                     'fastest_lap_rank': fastest_lap.get('rank', '') if fastest_lap else '',
                 })
 
-            return {
+            race_results = {
                 'race_name': race.get('raceName', 'Unknown Race'),
                 'round': round_number,
                 'date': race.get('date', ''),
@@ -207,6 +217,9 @@ class F1FetcherMixin:
                 'results': results,
                 'has_results': len(results) > 0
             }
+            if race_results['has_results']:
+                put_final('f1', f"2025:{round_number}", race_results)
+            return race_results
 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error fetching F1 race results: {str(e)}")
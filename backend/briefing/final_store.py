@@ -0,0 +1,102 @@
+"""
+Write-once on-disk store for data of finished games.
+
+Once a game is final its summary, boxscore and linescores never change, so
+they are stored permanently under (sport, event_id) and later reads never
+go upstream. The first write for a key wins; entries are never updated.
+
+The store lives under BRIEFING_CACHE_DIR, which must be on persistent storage
+(a Fly volume in production) for it to outlive a machine stop.
+"""
+
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from .cache import cache_dir
+
+
+class FinalStore:
+    """SQLite table of zlib-compressed JSON payloads keyed by (sport, event_id)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS final_payloads ("
+                "sport TEXT NOT NULL, event_id TEXT NOT NULL, payload BLOB NOT NULL, stored_at REAL NOT NULL, "
+                "PRIMARY KEY (sport, event_id))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, so keep one per thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=2)
+            self._local.conn = conn
+        return conn
+
+    def get(self, sport: str, event_id: str) -> Optional[Any]:
+        row = self._connect().execute(
+            "SELECT payload FROM final_payloads WHERE sport = ? AND event_id = ?", (sport, str(event_id))
+        ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def put(self, sport: str, event_id: str, payload: Any) -> bool:
+        """Store a payload unless one already exists. Returns True if it was written."""
+        blob = zlib.compress(json.dumps(payload, separators=(',', ':')).encode())
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO final_payloads (sport, event_id, payload, stored_at) VALUES (?, ?, ?, ?)",
+                (sport, str(event_id), blob, time.time()),
+            )
+            return cursor.rowcount > 0
+
+
+_final_store: Optional[FinalStore] = None
+_final_store_loaded = False
+_final_store_lock = threading.Lock()
+
+
+def get_final_store() -> Optional[FinalStore]:
+    """Get the shared store at <BRIEFING_CACHE_DIR>/final.sqlite3, or None if it can't be opened."""
+    global _final_store, _final_store_loaded
+    if not _final_store_loaded:
+        with _final_store_lock:
+            if not _final_store_loaded:
+                try:
+                    _final_store = FinalStore(cache_dir() / 'final.sqlite3')
+                except (OSError, sqlite3.Error) as e:
+                    print(f"[FinalStore] Unavailable, finished games will be refetched: {e}")
+                _final_store_loaded = True
+    return _final_store
+
+
+def get_final(sport: str, event_id: str) -> Optional[Any]:
+    """Read a stored payload; store errors are treated as a miss."""
+    store = get_final_store()
+    if store is None:
+        return None
+    try:
+        return store.get(sport, event_id)
+    except (sqlite3.Error, ValueError, zlib.error) as e:
+        print(f"[FinalStore] Error reading {sport}/{event_id}: {e}")
+        return None
+
+
+def put_final(sport: str, event_id: str, payload: Any):
+    """Store a finished game's payload once; store errors are logged and ignored."""
+    store = get_final_store()
+    if store is None:
+        return
+    try:
+        store.put(sport, event_id, payload)
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        print(f"[FinalStore] Error writing {sport}/{event_id}: {e}")
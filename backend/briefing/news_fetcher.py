@@ -2,13 +2,15 @@
 News fetcher module for retrieving and parsing RSS feeds.
 """
 
-import feedparser
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .rss_parser import FeedParseError, clean_summary, parse_feed
+
 
 class NewsFetcher:
     """Fetches and parses news from RSS feeds."""
@@ -24,14 +26,19 @@ class NewsFetcher:
         'hackernews': 'https://hnrss.org/frontpage',
     }
 
-    def __init__(self, timeout: int = 10):
+    # Upper bound on fetch_multiple_feeds, however many sources are requested
+    DEFAULT_DEADLINE = 8
+
+    def __init__(self, timeout: int = 10, deadline: float = DEFAULT_DEADLINE):
         """
         Initialize the news fetcher.
 
         Args:
             timeout: Request timeout in seconds
+            deadline: Seconds fetch_multiple_feeds waits for all feeds together
         """
         self.timeout = timeout
+        self.deadline = deadline
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
@@ -47,47 +54,82 @@ class NewsFetcher:
         session.mount('https://', adapter)
         return session
 
-    def fetch_feed(self, feed_url: str) -> List[Dict[str, str]]:
+    def fetch_feed(self, feed_url: str, limit: int = 10) -> List[Dict[str, str]]:
         """
         Fetch and parse a single RSS feed.
 
+        The body is streamed through the incremental parser, which stops after
+        `limit` items; feedparser is only used for feeds it can't parse.
+
         Args:
             feed_url: URL of the RSS feed
+            limit: Maximum number of items to return
 
         Returns:
             List of news items with title, summary, link, and published date
         """
         try:
-            response = self.session.get(feed_url, timeout=self.timeout)
-            response.raise_for_status()
-
-            feed = feedparser.parse(response.content)
-
-            if feed.bozo:
-                # Feed has errors but might still be parseable
-                if hasattr(feed, 'bozo_exception'):
-                    print(f"Warning: Feed parsing issue: {feed.bozo_exception}")
-
-            news_items = []
-            for entry in feed.entries[:10]:  # Limit to 10 most recent items
-                item = {
-                    'title': entry.get('title', 'No title'),
-                    'summary': self._clean_summary(entry.get('summary', entry.get('description', 'No summary available'))),
-                    'link': entry.get('link', ''),
-                    'published': self._parse_date(entry.get('published', entry.get('updated', ''))),
+            with self.session.get(feed_url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+
+                received: List[bytes] = []
+
+                def read_chunks():
+                    for chunk in response.iter_content(chunk_size=16384):
+                        received.append(chunk)
+                        yield chunk
+
+                chunks = read_chunks()
+                try:
+                    entries = parse_feed(chunks, limit)
+                except FeedParseError as e:
+                    print(f"Warning: Falling back to feedparser for {feed_url}: {e}")
+                    # Read the rest of the body so feedparser sees the whole document
+                    for _ in chunks:
+                        pass
+                    entries = self._parse_with_feedparser(b''.join(received), limit)
+
+            return [
+                {
+                    'title': entry['title'],
+                    'summary': self._clean_summary(entry['summary']),
+                    'link': entry['link'],
+                    'published': self._parse_date(entry['published']),
                 }
-                news_items.append(item)
-
-            return news_items
+                for entry in entries
+            ]
 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error fetching feed {feed_url}: {str(e)}")
         except Exception as e:
             raise Exception(f"Error parsing feed {feed_url}: {str(e)}")
 
+    @staticmethod
+    def _parse_with_feedparser(content: bytes, limit: int) -> List[Dict[str, str]]:
+        """Parse a feed the streaming parser rejected, with feedparser's lenient parser."""
+        # Deferred so the API process doesn't pay for feedparser unless a feed needs it
+        import feedparser
+
+        feed = feedparser.parse(content)
+
+        if feed.bozo:
+            # Feed has errors but might still be parseable
+            if hasattr(feed, 'bozo_exception'):
+                print(f"Warning: Feed parsing issue: {feed.bozo_exception}")
+
+        return [
+            {
+                'title': entry.get('title', 'No title'),
+                'summary': entry.get('summary', entry.get('description', 'No summary available')),
+                'link': entry.get('link', ''),
+                'published': entry.get('published', entry.get('updated', '')),
+            }
+            for entry in feed.entries[:limit]
+        ]
+
     def fetch_multiple_feeds(self, sources: List[str]) -> Dict[str, List[Dict[str, str]]]:
         """
-        Fetch multiple RSS feeds.
+        Fetch multiple RSS feeds concurrently.
 
         Args:
             sources: List of source names or URLs
@@ -95,34 +137,58 @@ class NewsFetcher:
         Returns:
             Dictionary mapping source names to their news items
         """
-        results = {}
+        results, _ = self.fetch_feeds_with_status(sources)
+        return results
+
+    def fetch_feeds_with_status(self, sources: List[str], limit: int = 10) -> Tuple[Dict[str, List[Dict[str, str]]], Dict[str, Dict]]:
+        """
+        Fetch multiple RSS feeds concurrently, waiting at most self.deadline seconds.
 
-        for source in sources:
-            # Check if it's a known source name or a URL
-            feed_url = self.DEFAULT_FEEDS.get(source.lower(), source)
+        Feeds that fail or miss the deadline get an empty list, so a slow
+        source never holds up the others.
 
+        Args:
+            sources: List of source names or URLs
+            limit: Maximum number of items per feed
+
+        Returns:
+            (results, status) - results as in fetch_multiple_feeds, status maps
+            each source to {'status': 'ok'|'error'|'timeout', ...}
+        """
+        if not sources:
+            return {}, {}
+
+        executor = ThreadPoolExecutor(max_workers=min(8, len(sources)))
+        # Check if it's a known source name or a URL
+        futures = [executor.submit(self.fetch_feed, self.DEFAULT_FEEDS.get(source.lower(), source), limit) for source in sources]
+        wait(futures, timeout=self.deadline)
+        # Don't wait for stragglers; they finish (or time out) in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        results = {}
+        status = {}
+        for source, future in zip(sources, futures):
+            if not future.done():
+                print(f"Timed out fetching {source} after {self.deadline}s")
+                results[source] = []
+                status[source] = {'status': 'timeout'}
+                continue
             try:
-                items = self.fetch_feed(feed_url)
+                items = future.result()
                 source_name = source.lower() if source.lower() in self.DEFAULT_FEEDS else 'custom'
                 results[source_name] = items
+                status[source_name] = {'status': 'ok', 'count': len(items)}
             except Exception as e:
                 print(f"Error fetching {source}: {str(e)}")
                 results[source] = []
+                status[source] = {'status': 'error', 'error': str(e)}
 
-        return results
+        return results, status
 
     @staticmethod
     def _clean_summary(summary: str) -> str:
         """Remove HTML tags and clean up summary text."""
-        import re
-        # Remove HTML tags
-        clean = re.sub('<[^<]+?>', '', summary)
-        # Remove extra whitespace
-        clean = ' '.join(clean.split())
-        # Limit length
-        if len(clean) > 200:
-            clean = clean[:197] + '...'
-        return clean
+        return clean_summary(summary)
 
     @staticmethod
     def _parse_date(date_str: str) -> str:
@@ -0,0 +1,257 @@
+"""
+In-memory store of ingested news articles.
+
+Feeds are polled in the background and their items kept here, keyed by link,
+so reads never wait on upstream feeds. Every new article gets an increasing
+sequence number, which clients use as a "since" cursor to fetch only what
+arrived after their last read.
+
+The same wire story is often carried by several sources with slightly
+different wording. Articles are clustered with MinHash signatures over word
+shingles (with LSH banding to find candidates), and the first article seen in
+a cluster represents it.
+"""
+
+import re
+import time
+import random
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .search_index import get_search_index
+
+_NUM_HASHES = 64
+_BAND_ROWS = 2  # 32 bands of 2 rows: candidates are found down to ~0.2 similarity, then verified
+_DUPLICATE_THRESHOLD = 0.5  # estimated Jaccard similarity above which two articles are the same story
+_SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1)  # fixed seed: signatures must be comparable across the process lifetime
+_HASH_PARAMS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(_NUM_HASHES)]
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+# Fields returned to clients for an article (the /api/news item shape)
+_ITEM_FIELDS = ('title', 'summary', 'link', 'published')
+
+
+def _shingles(text: str) -> Set[str]:
+    words = _WORD.findall(text.lower())
+    if len(words) < _SHINGLE_SIZE:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + _SHINGLE_SIZE]) for i in range(len(words) - _SHINGLE_SIZE + 1)}
+
+
+def minhash(text: str) -> Optional[Tuple[int, ...]]:
+    """MinHash signature of the text's word shingles, or None for text without words."""
+    hashes = [zlib.crc32(shingle.encode()) for shingle in _shingles(text)]
+    if not hashes:
+        return None
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _HASH_PARAMS)
+
+
+def _similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / _NUM_HASHES
+
+
+def _bands(signature: Tuple[int, ...]) -> List[Tuple]:
+    return [(i, signature[i:i + _BAND_ROWS]) for i in range(0, _NUM_HASHES, _BAND_ROWS)]
+
+
+class NewsStore:
+    """Bounded store of articles from all polled sources, oldest evicted first."""
+
+    def __init__(self, max_items: int = 2000):
+        self.max_items = max_items
+        self._articles: "OrderedDict[str, Dict]" = OrderedDict()  # {key: article}, in sequence order
+        self._latest: Dict[str, List[str]] = {}  # {source: keys of its last poll, in feed order}
+        self._status: Dict[str, Dict] = {}  # {source: {'status', 'polled_at', ...}}
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: Dict[Tuple, Set[str]] = {}  # {LSH band: keys}
+        self._clusters: Dict[str, List[str]] = {}  # {representative key: member keys}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(source: str, item: Dict) -> str:
+        return item.get('link') or f"{source}:{item.get('title', '')}"
+
+    def ingest(self, source: str, items: List[Dict]) -> int:
+        """
+        Add a source's latest feed items.
+
+        Returns:
+            Number of articles that weren't in the store yet
+        """
+        added = 0
+        with self._lock:
+            keys = []
+            for item in items:
+                key = self._key(source, item)
+                keys.append(key)
+                existing = self._articles.get(key)
+                if existing is not None:
+                    if any(existing[field] != item.get(field, '') for field in _ITEM_FIELDS):
+                        existing.update({field: item.get(field, '') for field in _ITEM_FIELDS})
+                        self._index(existing)
+                    continue
+                self._seq += 1
+                article = {field: item.get(field, '') for field in _ITEM_FIELDS}
+                article.update({'id': key, 'source': source, 'seq': self._seq, 'cluster': key})
+                self._articles[key] = article
+                self._assign_cluster(key, article)
+                self._index(article)
+                added += 1
+            self._latest[source] = keys
+            self._status[source] = {'status': 'ok', 'polled_at': time.time(), 'count': len(keys)}
+            while len(self._articles) > self.max_items:
+                self._evict(next(iter(self._articles)))
+        return added
+
+    @staticmethod
+    def _index(article: Dict):
+        get_search_index().add(
+            article['id'], article['title'], article['summary'],
+            link=article['link'], published=article['published'], source=article['source'],
+        )
+
+    def record_error(self, source: str, error: str):
+        """Remember a failed poll; the source's previous items keep being served."""
+        with self._lock:
+            previous = self._status.get(source, {})
+            self._status[source] = {**previous, 'status': 'error', 'error': error, 'failed_at': time.time()}
+
+    def _assign_cluster(self, key: str, article: Dict):
+        signature = minhash(f"{article['title']} {article['summary']}")
+        if signature is None:
+            self._clusters[key] = [key]
+            return
+
+        best, best_similarity = None, _DUPLICATE_THRESHOLD
+        candidates = set()
+        for band in _bands(signature):
+            candidates |= self._buckets.get(band, set())
+        for candidate in candidates:
+            similarity = _similarity(signature, self._signatures[candidate])
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+
+        if best is not None:
+            cluster = self._articles[best]['cluster']
+            article['cluster'] = cluster
+            self._clusters.setdefault(cluster, []).append(key)
+        else:
+            self._clusters[key] = [key]
+
+        self._signatures[key] = signature
+        for band in _bands(signature):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def _evict(self, key: str):
+        article = self._articles.pop(key)
+        get_search_index().remove(key)
+        signature = self._signatures.pop(key, None)
+        if signature is not None:
+            for band in _bands(signature):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[band]
+        cluster = article['cluster']
+        members = self._clusters.get(cluster)
+        if members is not None:
+            members.remove(key)
+            if not members:
+                del self._clusters[cluster]
+            elif key == cluster:
+                # The representative left: the oldest surviving member represents the story now
+                representative = members[0]
+                for member in members:
+                    self._articles[member]['cluster'] = representative
+                self._clusters[representative] = self._clusters.pop(cluster)
+
+    def has_source(self, source: str) -> bool:
+        """True once a source was ingested at least once."""
+        return source in self._latest
+
+    def latest(self, source: str, limit: int = 10, exclude_clusters: Optional[Set[str]] = None) -> List[Dict]:
+        """
+        Items of the source's last poll in feed order, in the /api/news item shape.
+
+        Args:
+            exclude_clusters: Skip articles of these clusters; the clusters of
+                the returned items are added to it (for de-duplicating across sources)
+        """
+        with self._lock:
+            items = []
+            for key in self._latest.get(source, []):
+                article = self._articles.get(key)
+                if article is None:
+                    continue
+                if exclude_clusters is not None:
+                    if article['cluster'] in exclude_clusters:
+                        continue
+                    exclude_clusters.add(article['cluster'])
+                items.append({field: article[field] for field in _ITEM_FIELDS})
+                if len(items) >= limit:
+                    break
+            return items
+
+    def status(self, source: str) -> Optional[Dict]:
+        with self._lock:
+            status = self._status.get(source)
+            return dict(status) if status else None
+
+    def since(self, cursor: int = 0, sources: Optional[Iterable[str]] = None, limit: int = 100) -> Dict:
+        """
+        Stories that arrived after `cursor`, newest first, one article per cluster.
+
+        Duplicates of a story are not returned again; instead each story lists
+        every source that carried it.
+
+        Returns:
+            {'items': [...], 'cursor': int} - pass 'cursor' back as `since` on the next call
+        """
+        source_filter = set(sources) if sources else None
+        with self._lock:
+            fresh = []
+            for article in reversed(self._articles.values()):
+                if article['seq'] <= cursor:
+                    break
+                fresh.append(article)
+
+            # Oldest first, so when the limit cuts the delta short the cursor resumes where it stopped
+            items = []
+            next_cursor = self._seq
+            for article in reversed(fresh):
+                if len(items) >= limit:
+                    next_cursor = items[-1]['seq']
+                    break
+                if article['cluster'] != article['id']:
+                    continue
+                if source_filter is not None and article['source'] not in source_filter:
+                    continue
+                members = self._clusters.get(article['id'], [article['id']])
+                item = dict(article)
+                item['sources'] = sorted({self._articles[k]['source'] for k in members if k in self._articles})
+                items.append(item)
+
+            items.reverse()
+            return {'items': items, 'cursor': next_cursor}
+
+
+_news_store: Optional[NewsStore] = None
+_news_store_lock = threading.Lock()
+
+
+def get_news_store() -> NewsStore:
+    """Get the process-wide news store."""
+    global _news_store
+    if _news_store is None:
+        with _news_store_lock:
+            if _news_store is None:
+                _news_store = NewsStore()
+    return _news_store
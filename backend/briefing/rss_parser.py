@@ -0,0 +1,112 @@
+"""
+Streaming RSS/Atom parser.
+
+Parses feed XML incrementally and stops as soon as the requested number of
+items has been read, so for large feeds most of the document is neither
+downloaded nor parsed. Handles RSS 2.0, RSS 1.0 (RDF) and Atom; anything it
+can't parse raises FeedParseError so callers can fall back to feedparser.
+"""
+
+import re
+import html
+from typing import Dict, Iterable, List, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+_ITEM_TAGS = ('item', 'entry')
+_SUMMARY_MAX_LENGTH = 200
+
+# Tags are dropped and whitespace runs collapsed in the same pass
+_TAG_OR_SPACE = re.compile(r'<[^<]+?>|\s+')
+
+
+class FeedParseError(Exception):
+    """Raised when a feed is not well-formed XML or contains no items."""
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def clean_summary(summary: str, max_length: int = _SUMMARY_MAX_LENGTH) -> str:
+    """Strip HTML tags, decode entities, collapse whitespace and truncate, in one pass over the text."""
+    clean = _TAG_OR_SPACE.sub(lambda m: ' ' if m.group(0)[0] != '<' else '', summary).strip()
+    clean = html.unescape(clean)
+    if len(clean) > max_length:
+        clean = clean[:max_length - 3] + '...'
+    return clean
+
+
+def _link(fields: Dict[str, Element]) -> str:
+    link = fields.get('link')
+    if link is None:
+        return ''
+    # Atom: <link rel="alternate" href="..."/>; RSS: <link>...</link>
+    return (link.get('href') or link.text or '').strip()
+
+
+def _parse_item(elem: Element) -> Dict[str, str]:
+    """Map an <item>/<entry> to raw title/summary/link/published strings."""
+    fields: Dict[str, Element] = {}
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == 'link' and child.get('rel', 'alternate') != 'alternate':
+            continue
+        fields.setdefault(name, child)
+
+    def text(*names: str) -> Optional[str]:
+        for name in names:
+            child = fields.get(name)
+            if child is not None and child.text and child.text.strip():
+                return child.text.strip()
+        return None
+
+    return {
+        'title': text('title') or 'No title',
+        'summary': text('description', 'summary', 'encoded', 'content') or 'No summary available',
+        'link': _link(fields),
+        'published': text('pubDate', 'published', 'updated', 'date') or '',
+    }
+
+
+def parse_feed(chunks: Iterable[bytes], limit: int = 10) -> List[Dict[str, str]]:
+    """
+    Parse the first `limit` items of a feed.
+
+    Args:
+        chunks: The feed body, e.g. response.iter_content() or [response.content];
+            iteration stops once enough items were read
+        limit: Maximum number of items to return
+
+    Returns:
+        Items with raw 'title', 'summary', 'link' and 'published' strings
+
+    Raises:
+        FeedParseError: The XML is malformed or has no items
+    """
+    parser = XMLPullParser(events=('end',))
+    items: List[Dict[str, str]] = []
+
+    def read_items() -> bool:
+        """Collect finished items; True once there are enough."""
+        for _, elem in parser.read_events():
+            if _local_name(elem.tag) in _ITEM_TAGS:
+                items.append(_parse_item(elem))
+                # Parsed items are no longer needed in the tree
+                elem.clear()
+                if len(items) >= limit:
+                    return True
+        return False
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            if read_items():
+                return items
+        parser.close()
+        read_items()
+    except ParseError as e:
+        raise FeedParseError(str(e))
+
+    if not items:
+        raise FeedParseError("No items found")
+    return items
@@ -0,0 +1,136 @@
+"""
+In-memory full-text index over ingested news items.
+
+Items from the RSS news store and ESPN sports news are added as they arrive
+and ranked with BM25. The index is an inverted index of {term: {doc: tf}},
+so a query only touches the postings of its own terms.
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+_K1 = 1.2
+_B = 0.75
+_TITLE_WEIGHT = 2  # title terms count this many times towards a document's term frequency
+
+_WORD = re.compile(r'[a-z0-9]+')
+_STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in is it its of on or that the this to was were will with'.split()
+)
+
+# Fields kept for each document and returned with results
+_DOC_FIELDS = ('title', 'summary', 'link', 'published', 'source')
+
+
+def tokenize(text: str) -> List[str]:
+    return [word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS]
+
+
+class SearchIndex:
+    """BM25-ranked inverted index, bounded to the most recently added documents."""
+
+    def __init__(self, max_docs: int = 5000):
+        self.max_docs = max_docs
+        self._docs: "OrderedDict[str, Dict]" = OrderedDict()  # {doc_id: fields}, oldest first
+        self._lengths: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}  # {term: {doc_id: term frequency}}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def add(self, doc_id: str, title: str, summary: str = '', **fields):
+        """Index a document, replacing any previous version with the same id."""
+        terms: Dict[str, int] = {}
+        for term in tokenize(title):
+            terms[term] = terms.get(term, 0) + _TITLE_WEIGHT
+        for term in tokenize(summary):
+            terms[term] = terms.get(term, 0) + 1
+
+        doc = {field: fields.get(field, '') for field in _DOC_FIELDS}
+        doc.update({'title': title, 'summary': summary})
+
+        with self._lock:
+            if doc_id in self._docs:
+                self._remove(doc_id)
+            self._docs[doc_id] = doc
+            length = sum(terms.values())
+            self._lengths[doc_id] = length
+            self._total_length += length
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[doc_id] = tf
+            while len(self._docs) > self.max_docs:
+                self._remove(next(iter(self._docs)))
+
+    def remove(self, doc_id: str):
+        with self._lock:
+            if doc_id in self._docs:
+                self._remove(doc_id)
+
+    def _remove(self, doc_id: str):
+        doc = self._docs.pop(doc_id)
+        self._total_length -= self._lengths.pop(doc_id)
+        for term in set(tokenize(doc['title'])) | set(tokenize(doc['summary'])):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def search(self, query: str, limit: int = 20, source: Optional[str] = None) -> List[Dict]:
+        """
+        Rank documents matching any query term.
+
+        Args:
+            query: Free text
+            limit: Maximum number of results
+            source: Only return documents from this source (e.g. 'bbc', 'espn-nfl')
+
+        Returns:
+            Documents with a 'score', best first
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._docs)
+            if not terms or not doc_count:
+                return []
+            avg_length = self._total_length / doc_count
+
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    norm = _K1 * (1 - _B + _B * self._lengths[doc_id] / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (_K1 + 1) / (tf + norm)
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+            results = []
+            for doc_id, score in ranked:
+                doc = self._docs[doc_id]
+                if source and doc['source'] != source:
+                    continue
+                results.append({**doc, 'score': round(score, 3)})
+                if len(results) >= limit:
+                    break
+            return results
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
+_search_index: Optional[SearchIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """Get the process-wide news search index."""
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = SearchIndex()
+    return _search_index
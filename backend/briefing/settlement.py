@@ -0,0 +1,178 @@
+"""
+Automatic settlement of pending bets whose games are final.
+
+Pending bets and parlay legs of all users are evaluated together with the
+same rules used for live tracking (PropsDashboard / _compute_prop_status),
+so each event's summary is fetched once per run no matter how many bets
+reference it. Outcomes are applied as one bulk update per status, and only
+to bets that are still Pending, which makes runs idempotent.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .props_dashboard import PropsDashboard
+from .supabase_service import supabase_service
+from . import background
+
+# Bet types and sports that PropsDashboard can evaluate from a game summary
+SETTLEABLE_TYPES = ('Prop', '1st Half', '1st Quarter', 'Team Total', 'Moneyline', 'Spread', 'Total', 'Parlay')
+SETTLEABLE_SPORTS = ('nba', 'nfl', 'mlb')
+
+_BET_STATUS_BY_PROP_STATUS = {'won': 'Won', 'lost': 'Lost', 'push': 'Pushed'}
+
+
+def _trackable(item: Dict, sport: str) -> bool:
+    """True if a bet or leg carries what's needed to evaluate it (combined props are left to the user)."""
+    return (
+        sport in SETTLEABLE_SPORTS
+        and bool(item.get('event_id'))
+        and bool(item.get('market_type'))
+        and not item.get('is_combined')
+    )
+
+
+def _evaluate(items: List[Tuple[str, Dict]], sports_fetcher) -> Tuple[List[Optional[str]], int]:
+    """
+    Evaluate (sport, item) pairs and return each item's final prop status, or
+    None while its game isn't over. Stored final statuses are reused as-is.
+
+    Returns:
+        (statuses in input order, number of events fetched)
+    """
+    statuses: List[Optional[str]] = [None] * len(items)
+    dashboards: Dict[str, PropsDashboard] = {}
+    positions: Dict[str, List[int]] = {}
+
+    for i, (sport, item) in enumerate(items):
+        if item.get('game_state') == 'post' and item.get('prop_status') in _BET_STATUS_BY_PROP_STATUS:
+            statuses[i] = item['prop_status']
+            continue
+
+        dashboard = dashboards.setdefault(sport, PropsDashboard(sport=sport))
+        dashboard.add_prop(
+            game_id=str(item['event_id']),
+            game_label=item.get('matchup', ''),
+            player_name=item.get('player_name') or '',
+            team_name=item.get('team_name') or '',
+            market_type=item['market_type'],
+            line=float(item.get('line') or 0),
+            side=item.get('side') or 'over',
+        )
+        positions.setdefault(sport, []).append(i)
+
+    events_fetched = 0
+    for sport, dashboard in dashboards.items():
+        # One summary fetch per event, shared by every user's bets on it
+        dashboard.refresh_props(sports_fetcher)
+        events_fetched += len({prop.game_id for prop in dashboard.props})
+        for i, prop in zip(positions[sport], dashboard.props):
+            if prop.game_state == 'post' and prop.prop_status in _BET_STATUS_BY_PROP_STATUS:
+                statuses[i] = prop.prop_status
+
+    return statuses, events_fetched
+
+
+def _parlay_status(leg_statuses: List[Optional[str]]) -> Optional[str]:
+    """
+    Settle a parlay from its legs' prop statuses.
+    Any lost leg loses it; it wins when every leg won and pushes when every leg pushed.
+    A mix of won and pushed legs changes the payout, so it is left for the user.
+    """
+    if 'lost' in leg_statuses:
+        return 'Lost'
+    if any(status is None for status in leg_statuses):
+        return None
+    if all(status == 'won' for status in leg_statuses):
+        return 'Won'
+    if all(status == 'push' for status in leg_statuses):
+        return 'Pushed'
+    return None
+
+
+def settle_pending_bets(sports_fetcher=None, dry_run: bool = False) -> Dict:
+    """
+    Find pending bets whose events are final and settle them as Won/Lost/Pushed.
+
+    Args:
+        sports_fetcher: Fetcher to use (defaults to the shared SportsFetcher)
+        dry_run: Evaluate and report without writing anything
+
+    Returns:
+        Summary with 'settled' (per status, the bets that were/would be settled),
+        'pending' (bets left pending), 'events_fetched' and 'dry_run'
+    """
+    if sports_fetcher is None:
+        from .sports_fetcher import get_sports_fetcher
+        sports_fetcher = get_sports_fetcher()
+
+    pending = supabase_service.get_pending_bets()
+    bets = [bet for bet in pending if bet['type'] in SETTLEABLE_TYPES]
+
+    # Flatten bets and parlay legs into one evaluation batch
+    items: List[Tuple[str, Dict]] = []
+    bet_items: Dict[str, List[int]] = {}
+    for bet in bets:
+        if bet['type'] == 'Parlay':
+            legs = bet.get('legs') or []
+            if not legs or not all(_trackable(leg, (leg.get('sport') or bet['sport']).lower()) for leg in legs):
+                continue
+            candidates = [((leg.get('sport') or bet['sport']).lower(), leg) for leg in legs]
+        else:
+            if not _trackable(bet, bet['sport'].lower()):
+                continue
+            candidates = [(bet['sport'].lower(), bet)]
+        bet_items[bet['id']] = list(range(len(items), len(items) + len(candidates)))
+        items.extend(candidates)
+
+    statuses, events_fetched = _evaluate(items, sports_fetcher)
+
+    settled: Dict[str, List[Dict]] = {'Won': [], 'Lost': [], 'Pushed': []}
+    for bet in bets:
+        indices = bet_items.get(bet['id'])
+        if indices is None:
+            continue
+        if bet['type'] == 'Parlay':
+            status = _parlay_status([statuses[i] for i in indices])
+        else:
+            status = _BET_STATUS_BY_PROP_STATUS.get(statuses[indices[0]])
+        if status:
+            settled[status].append({
+                'id': bet['id'],
+                'user_id': bet['user_id'],
+                'type': bet['type'],
+                'matchup': bet['matchup'],
+                'selection': bet['selection'],
+            })
+
+    if not dry_run:
+        # User stats are recalculated by the recalculate_stats_on_bet_update trigger
+        for status, status_bets in settled.items():
+            if not status_bets:
+                continue
+            # Only bets still Pending are updated, so a concurrent run or user edit wins
+            updated = supabase_service.settle_bets([b['id'] for b in status_bets], status)
+            updated_ids = {row['id'] for row in updated}
+            settled[status] = [b for b in status_bets if b['id'] in updated_ids]
+
+    settled_count = sum(len(status_bets) for status_bets in settled.values())
+    print(f"[Settlement] {'Would settle' if dry_run else 'Settled'} {settled_count}/{len(pending)} pending bets "
+          f"({events_fetched} events fetched)")
+
+    return {
+        'dry_run': dry_run,
+        'settled': settled,
+        'pending': len(pending) - settled_count,
+        'events_fetched': events_fetched,
+    }
+
+
+def start_settlement_job():
+    """
+    Settle bets periodically when BRIEFING_AUTO_SETTLE_INTERVAL (seconds) is set.
+    Off by default; backend/settle_bets.py runs the same job once (e.g. from cron).
+    """
+    interval = os.getenv('BRIEFING_AUTO_SETTLE_INTERVAL')
+    if not interval:
+        return
+    background.run_periodically('bet-settlement', float(interval), settle_pending_bets, initial_delay=60)
@@ -44,6 +44,11 @@ class SoccerFetcherMixin:
         league_path = self.SOCCER_LEAGUE_PATHS.get(league.lower(), 'eng.1')
         url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league_path}/summary?event={event_id}"
 
+        # Finished matches are cached by BaseSportsFetcher
+        cached = self._get_finished_summary(f"soccer/{league_path}", event_id)
+        if cached is not None:
+            return cached
+
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
@@ -104,6 +109,9 @@ class SoccerFetcherMixin:
             except Exception:
                 pass
 
+            if state == "post":
+                self._store_finished_summary(f"soccer/{league_path}", event_id, data)
+
             return data
 
         except requests.exceptions.RequestException as e:
@@ -2,6 +2,11 @@
 Sports fetcher module for retrieving data from ESPN public APIs.
 """
 
+import time
+import threading
+from typing import Any, Optional
+from . import cache_snapshot
+from .cache import TieredCache
 from .base_fetcher import BaseSportsFetcher
 from .nfl_fetcher import NFLFetcherMixin
 from .nba_fetcher import NBAFetcherMixin
@@ -23,4 +28,58 @@ class SportsFetcher(
 ):
     """Fetches sports scores and news from ESPN public JSON endpoints."""
     # Logic is now distributed across BaseSportsFetcher and Mixins
-    pass
+
+    STANDINGS_SPORTS = ['nba', 'mlb', 'f1', 'nfl', 'soccer', 'epl', 'laliga', 'ucl', 'europa']
+
+    def fetch_standings(self, sport: str) -> Any:
+        """
+        Fetch standings for a sport, cached for _STANDINGS_CACHE_TTL.
+
+        Raises:
+            ValueError: If standings aren't supported for the sport
+        """
+        sport = sport.lower()
+        if sport not in self.STANDINGS_SPORTS:
+            raise ValueError(f"Standings not supported for {sport}")
+
+        cache_entry = _standings_cache.get(sport)
+        if cache_entry and (time.time() - cache_entry['timestamp']) < _STANDINGS_CACHE_TTL:
+            return cache_entry['data']
+
+        if sport == 'nba':
+            standings = self.fetch_nba_standings()
+        elif sport == 'mlb':
+            standings = self.fetch_mlb_standings()
+        elif sport == 'f1':
+            standings = self.fetch_f1_standings()
+        elif sport == 'nfl':
+            standings = self.fetch_nfl_standings()
+        else:
+            standings = self.fetch_soccer_standings(league=sport)
+
+        _standings_cache[sport] = {'data': standings, 'timestamp': time.time()}
+        return standings
+
+
+_STANDINGS_CACHE_TTL = 900  # 15 minutes in seconds
+_standings_cache = TieredCache('standings', _STANDINGS_CACHE_TTL)  # {sport: {'data': ..., 'timestamp': float}}
+cache_snapshot.register('standings', _standings_cache, _STANDINGS_CACHE_TTL)
+
+
+_shared_fetcher: Optional[SportsFetcher] = None
+_shared_fetcher_lock = threading.Lock()
+
+
+def get_sports_fetcher() -> SportsFetcher:
+    """
+    Get the process-wide SportsFetcher, created on first use.
+
+    All API routes share it, so they also share one HTTP session and its
+    connection pool to ESPN.
+    """
+    global _shared_fetcher
+    if _shared_fetcher is None:
+        with _shared_fetcher_lock:
+            if _shared_fetcher is None:
+                _shared_fetcher = SportsFetcher()
+    return _shared_fetcher
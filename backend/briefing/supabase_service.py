@@ -3,26 +3,62 @@ Supabase Service for Bets Management
 Handles all database operations for bets using Supabase
 """
 import os
-from typing import List, Optional, Dict, Any
-from supabase import create_client, Client
+import threading
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 
 class SupabaseService:
+    """
+    Supabase access for the API. The client (and the supabase package itself)
+    is created on first use rather than at import, so the API process starts
+    without touching the network or the env file.
+    """
     _instance: Optional['SupabaseService'] = None
-    _client: Optional[Client] = None
+    _client: Optional['Client'] = None
+    _env_loaded = False
+    _init_lock = threading.Lock()
+
+    # Frontend bet field -> (bets column, converter); parlay legs are the extra 'legs' field
+    BET_FIELDS = {
+        'id': ('id', None),
+        'sport': ('sport', None),
+        'type': ('type', None),
+        'matchup': ('matchup', None),
+        'selection': ('selection', None),
+        'odds': ('odds', float),
+        'stake': ('stake', float),
+        'status': ('status', None),
+        'date': ('date', None),
+        'book': ('book', None),
+        'potentialPayout': ('potential_payout', float),
+        'event_id': ('event_id', None),
+        'player_name': ('player_name', None),
+        'team_name': ('team_name', None),
+        'market_type': ('market_type', None),
+        'line': ('line', float),
+        'side': ('side', None),
+        'current_value': ('current_value', float),
+        'current_value_str': ('current_value_str', None),
+        'game_state': ('game_state', None),
+        'game_status_text': ('game_status_text', None),
+        'prop_status': ('prop_status', None),
+    }
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        if self._client is None:
-            self._init_client()
+    @classmethod
+    def load_env(cls):
+        """Load Supabase settings from frontend/.env if environment variables not set"""
+        if cls._env_loaded:
+            return
+        cls._env_loaded = True
 
-    def _init_client(self):
-        """Initialize the Supabase client by reading env from frontend/.env"""
-        # Read from frontend/.env if environment variables not set
         if not os.getenv('SUPABASE_URL'):
             env_file = os.path.join(os.path.dirname(__file__), '..', '..', 'frontend', '.env')
             if os.path.exists(env_file):
@@ -39,6 +75,11 @@ class SupabaseService:
                             elif key.startswith('SUPABASE_'):
                                 os.environ[key] = value
 
+    def _init_client(self):
+        """Initialize the Supabase client by reading env from frontend/.env"""
+        from supabase import create_client
+
+        self.load_env()
         url = os.getenv('SUPABASE_URL')
         # Use service role key for backend (bypasses RLS)
         # Fall back to anon key if service role not available
@@ -47,18 +88,71 @@ class SupabaseService:
         if not url or not key:
             raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (or SUPABASE_ANON_KEY) must be set")
 
-        self._client = create_client(url, key)
+        SupabaseService._client = create_client(url, key)
 
     @property
-    def client(self) -> Client:
+    def client(self) -> 'Client':
         if self._client is None:
-            self._init_client()
+            with self._init_lock:
+                if self._client is None:
+                    self._init_client()
         return self._client
 
-    def get_bets(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all bets for a user"""
-        result = self.client.table('bets').select('*, parlay_legs(*)').eq('user_id', user_id).order('created_at', desc=True).execute()
-        return self._transform_bets_from_db(result.data)
+    def get_bets(self, user_id: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get all bets for a user.
+
+        Args:
+            fields: Frontend bet fields to return (see BET_FIELDS, plus 'legs');
+                only their columns are selected. All fields when omitted.
+        """
+        if fields is None:
+            columns = '*, parlay_legs(*)'
+        else:
+            columns = ', '.join(
+                ['id'] + [self.BET_FIELDS[f][0] for f in fields if f in self.BET_FIELDS and f != 'id']
+                + (['parlay_legs(*)'] if 'legs' in fields else [])
+            )
+        result = self.client.table('bets').select(columns).eq('user_id', user_id).order('created_at', desc=True).execute()
+        return self._transform_bets_from_db(result.data, fields)
+
+    def get_pending_bets(self) -> List[Dict[str, Any]]:
+        """Get pending bets of all users for settlement, in the get_bets shape plus 'user_id'"""
+        rows = []
+        page_size = 1000
+        start = 0
+        while True:
+            result = (
+                self.client.table('bets').select('*, parlay_legs(*)')
+                .eq('status', 'Pending')
+                .order('created_at')
+                .range(start, start + page_size - 1)
+                .execute()
+            )
+            for row in result.data:
+                bet = self._transform_bet_from_db(row)
+                bet['user_id'] = row['user_id']
+                rows.append(bet)
+            if len(result.data) < page_size:
+                return rows
+            start += page_size
+
+    def settle_bets(self, bet_ids: List[str], status: str) -> List[Dict[str, Any]]:
+        """
+        Set status on bets that are still Pending (safe to repeat).
+        Returns the rows that were actually updated.
+        """
+        updated = []
+        # Chunked to keep the id filter within URL length limits
+        for i in range(0, len(bet_ids), 200):
+            result = (
+                self.client.table('bets').update({'status': status})
+                .in_('id', bet_ids[i:i + 200])
+                .eq('status', 'Pending')
+                .execute()
+            )
+            updated.extend(result.data or [])
+        return updated
 
     def get_bet(self, bet_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Get a single bet by ID"""
@@ -151,6 +245,18 @@ class SupabaseService:
             return self._transform_bet_from_db(result.data[0])
         return None
 
+    def save_live_state(self, user_id: str, bets: List[Dict[str, Any]], legs: List[Dict[str, Any]]):
+        """
+        Store live tracking fields (current_value, game_state, prop_status...) for
+        many bets and parlay legs in one call. Rows are dicts with 'id' plus the fields;
+        unchanged rows are not rewritten (see migration 009).
+        """
+        self.client.rpc('save_live_state', {
+            'p_user_id': user_id,
+            'p_bets': bets,
+            'p_legs': legs,
+        }).execute()
+
     def delete_bet(self, bet_id: str, user_id: str) -> bool:
         """Delete a bet"""
         result = self.client.table('bets').delete().eq('id', bet_id).eq('user_id', user_id).execute()
@@ -265,32 +371,17 @@ class SupabaseService:
             'legs': bet.get('legs'),  # Will be extracted before insert
         }
 
-    def _transform_bet_from_db(self, db_bet: Dict[str, Any]) -> Dict[str, Any]:
-        """Transform database bet format to frontend format"""
-        bet = {
-            'id': db_bet['id'],
-            'sport': db_bet['sport'],
-            'type': db_bet['type'],
-            'matchup': db_bet['matchup'],
-            'selection': db_bet['selection'],
-            'odds': float(db_bet['odds']),
-            'stake': float(db_bet['stake']),
-            'status': db_bet['status'],
-            'date': db_bet['date'],
-            'book': db_bet.get('book'),
-            'potentialPayout': float(db_bet['potential_payout']),
-            'event_id': db_bet.get('event_id'),
-            'player_name': db_bet.get('player_name'),
-            'team_name': db_bet.get('team_name'),
-            'market_type': db_bet.get('market_type'),
-            'line': float(db_bet['line']) if db_bet.get('line') is not None else None,
-            'side': db_bet.get('side'),
-            'current_value': float(db_bet['current_value']) if db_bet.get('current_value') is not None else None,
-            'current_value_str': db_bet.get('current_value_str'),
-            'game_state': db_bet.get('game_state'),
-            'game_status_text': db_bet.get('game_status_text'),
-            'prop_status': db_bet.get('prop_status'),
-        }
+    def _transform_bet_from_db(self, db_bet: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Transform database bet format to frontend format (only `fields` when given)"""
+        bet = {}
+        for field, (column, convert) in self.BET_FIELDS.items():
+            if fields is not None and field not in fields:
+                continue
+            value = db_bet.get(column)
+            bet[field] = convert(value) if convert and value is not None else value
+
+        if fields is not None and 'legs' not in fields:
+            return bet
 
         # Add parlay legs if present
         if 'parlay_legs' in db_bet and db_bet['parlay_legs']:
@@ -311,20 +402,33 @@ class SupabaseService:
                     # Combined prop fields - Supabase returns JSONB as Python objects
                     'is_combined': leg.get('is_combined'),
                     'combined_players': leg.get('combined_players'),
+                    # Live tracking fields (stored once the leg's game is final)
+                    'id': leg.get('id'),
+                    'current_value': float(leg['current_value']) if leg.get('current_value') is not None else None,
+                    'current_value_str': leg.get('current_value_str'),
+                    'game_state': leg.get('game_state'),
+                    'game_status_text': leg.get('game_status_text'),
+                    'prop_status': leg.get('prop_status'),
                 })
             bet['legs'] = processed_legs
 
         return bet
 
-    def _transform_bets_from_db(self, db_bets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _transform_bets_from_db(self, db_bets: List[Dict[str, Any]], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Transform a list of database bets to frontend format"""
-        return [self._transform_bet_from_db(b) for b in db_bets]
+        return [self._transform_bet_from_db(b, fields) for b in db_bets]
 
     # ==================== Pinned Games Methods ====================
 
     def get_pinned_games(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all pinned games for a user"""
-        result = self.client.table('pinned_games').select('*').eq('user_id', user_id).order('pinned_at', desc=True).execute()
+        """Get pinned games for a user, leaving out games that ended over an hour ago"""
+        result = (
+            self.client.table('pinned_games').select('*')
+            .eq('user_id', user_id)
+            .or_(f"game_end_time.is.null,game_end_time.gte.{self._pinned_game_cutoff()}")
+            .order('pinned_at', desc=True)
+            .execute()
+        )
         return result.data
 
     def pin_game(self, user_id: str, game_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -356,15 +460,31 @@ class SupabaseService:
         """Update the game end time for auto-cleanup"""
         self.client.table('pinned_games').update({'game_end_time': end_time}).eq('event_id', event_id).execute()
 
-    def cleanup_ended_games(self, user_id: str) -> int:
-        """Remove pinned games that ended more than 60 minutes ago"""
+    @staticmethod
+    def _pinned_game_cutoff() -> str:
+        """Pinned games that ended before this time (60 minutes ago) are expired"""
         from datetime import datetime, timedelta
 
-        cutoff_time = datetime.utcnow() - timedelta(minutes=60)
-        cutoff_str = cutoff_time.isoformat()
+        return (datetime.utcnow() - timedelta(minutes=60)).isoformat()
+
+    def get_unended_pinned_games(self) -> List[Dict[str, Any]]:
+        """Get event_id/sport of all users' pinned games that have no end time yet"""
+        result = self.client.table('pinned_games').select('event_id, sport').is_('game_end_time', 'null').execute()
+        return result.data
+
+    def mark_pinned_games_ended(self, event_ids: List[str], end_time: str) -> int:
+        """Set game_end_time on every pin of the given events that doesn't have one yet"""
+        result = (
+            self.client.table('pinned_games').update({'game_end_time': end_time})
+            .in_('event_id', event_ids)
+            .is_('game_end_time', 'null')
+            .execute()
+        )
+        return len(result.data) if result.data else 0
 
-        # Delete games where game_end_time is set and is older than 60 minutes
-        result = self.client.table('pinned_games').delete().eq('user_id', user_id).lt('game_end_time', cutoff_str).execute()
+    def cleanup_ended_games(self) -> int:
+        """Remove all users' pinned games that ended more than 60 minutes ago"""
+        result = self.client.table('pinned_games').delete().lt('game_end_time', self._pinned_game_cutoff()).execute()
         return len(result.data) if result.data else 0
 
     # ==================== Favorite Teams Methods ====================
@@ -401,30 +521,47 @@ class SupabaseService:
 
     def sync_favorite_teams(self, user_id: str, teams: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Sync favorite teams - replaces all current favorites with the provided list.
+        Sync favorite teams - makes the user's favorites match the provided list.
         This is used when the frontend sends its full list of favorites.
-        """
-        # Delete all current favorites for user
-        self.client.table('favorite_teams').delete().eq('user_id', user_id).execute()
-
-        # Insert all new favorites
-        if teams:
-            db_teams = []
-            for team in teams:
-                db_teams.append({
-                    'user_id': user_id,
-                    'team_id': team['id'],
-                    'team_name': team['name'],
-                    'abbreviation': team.get('abbreviation'),
-                    'logo': team.get('logo'),
-                    'sport': team['sport'],
-                    'sport_display': team.get('sportDisplay'),
-                })
-
-            result = self.client.table('favorite_teams').insert(db_teams).execute()
-            return [self._transform_favorite_team_from_db(t) for t in result.data]
 
-        return []
+        Only the difference is written: new or changed teams in one upsert and
+        removed teams in one delete, so an unchanged list costs a single read.
+        """
+        result = self.client.table('favorite_teams').select('*').eq('user_id', user_id).execute()
+        current = {(row['team_id'], row['sport']): row for row in result.data}
+
+        desired: Dict[tuple, Dict[str, Any]] = {}
+        for team in teams:
+            desired.setdefault((team['id'], team['sport']), {
+                'user_id': user_id,
+                'team_id': team['id'],
+                'team_name': team['name'],
+                'abbreviation': team.get('abbreviation'),
+                'logo': team.get('logo'),
+                'sport': team['sport'],
+                'sport_display': team.get('sportDisplay'),
+            })
+
+        # New teams, plus existing ones whose name/logo/etc. changed
+        to_upsert = [
+            row for key, row in desired.items()
+            if key not in current or any(current[key].get(field) != value for field, value in row.items())
+        ]
+        to_delete = [row['id'] for key, row in current.items() if key not in desired]
+
+        if to_upsert:
+            # added_at isn't sent, so existing rows keep their original value
+            result = self.client.table('favorite_teams').upsert(
+                to_upsert,
+                on_conflict='user_id,team_id,sport'
+            ).execute()
+            for row in result.data:
+                current[(row['team_id'], row['sport'])] = row
+
+        if to_delete:
+            self.client.table('favorite_teams').delete().eq('user_id', user_id).in_('id', to_delete).execute()
+
+        return [self._transform_favorite_team_from_db(current.get(key, row)) for key, row in desired.items()]
 
     def _transform_favorite_team_from_db(self, db_team: Dict[str, Any]) -> Dict[str, Any]:
         """Transform database favorite team format to frontend format"""
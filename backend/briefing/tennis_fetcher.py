@@ -5,6 +5,7 @@ Tennis specific fetcher logic using the header API for match data.
 import requests
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
+from .final_store import get_final, put_final
 
 
 class TennisFetcherMixin:
@@ -23,6 +24,11 @@ class TennisFetcherMixin:
         """
         url = f"https://site.api.espn.com/apis/v2/scoreboard/header?sport=tennis&league={league}"
 
+        # Completed matches are served from the permanent store (they also drop off the header API)
+        stored = get_final(f"tennis/{league}", event_id)
+        if stored is not None:
+            return stored
+
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
@@ -38,7 +44,10 @@ class TennisFetcherMixin:
                         comp_id = str(event.get('competitionId', ''))
                         evt_id = str(event.get('id', ''))
                         if comp_id == str(event_id) or evt_id == str(event_id):
-                            return self._parse_tennis_match(event)
+                            match = self._parse_tennis_match(event)
+                            if match.get('completed') and not match.get('error'):
+                                put_final(f"tennis/{league}", event_id, match)
+                            return match
 
             return {"error": "Match not found"}
 
@@ -1,7 +1,124 @@
-from typing import Optional
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+import jwt
 from fastapi import Header, HTTPException
 from briefing.supabase_service import supabase_service
 
+# LRU of recently validated tokens: {sha256(token): (user_id, exp)}
+# Entries are only served until the token's own `exp`, so a cached token never
+# outlives its signature's validity.
+_token_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+_TOKEN_CACHE_SIZE = 1024
+_FALLBACK_TOKEN_TTL = 60  # seconds, used when a remotely validated token carries no exp
+
+# Supabase signs access tokens with the project JWT secret (HS256) or, on newer
+# projects, with asymmetric keys published at the JWKS endpoint.
+_JWKS_CACHE_TTL = 3600  # 1 hour in seconds
+_jwks_client: Optional[jwt.PyJWKClient] = None
+_jwks_client_lock = threading.Lock()
+_fallback_reported = False  # the Supabase Auth fallback is logged once, not on every request
+
+
+class _LocalVerificationUnavailable(Exception):
+    """Raised when a token can't be checked locally and Supabase Auth must decide."""
+
+
+def _get_jwks_client() -> jwt.PyJWKClient:
+    """Get the shared JWKS client (signing keys are cached inside the client)."""
+    global _jwks_client
+    if _jwks_client is None:
+        with _jwks_client_lock:
+            if _jwks_client is None:
+                supabase_url = os.getenv('SUPABASE_URL')
+                if not supabase_url:
+                    raise _LocalVerificationUnavailable("SUPABASE_URL not set")
+                _jwks_client = jwt.PyJWKClient(
+                    f"{supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json",
+                    cache_jwk_set=True,
+                    lifespan=_JWKS_CACHE_TTL,
+                    timeout=5,
+                )
+    return _jwks_client
+
+
+def _verify_token_locally(token: str) -> dict:
+    """
+    Verify signature, expiry and audience of a Supabase access token.
+
+    Raises jwt.InvalidTokenError for tokens that are definitely invalid and
+    _LocalVerificationUnavailable when no key is available to check them.
+    """
+    # SUPABASE_URL / SUPABASE_JWT_SECRET may live in frontend/.env
+    supabase_service.load_env()
+    alg = jwt.get_unverified_header(token).get('alg', '')
+
+    if alg == 'HS256':
+        key = os.getenv('SUPABASE_JWT_SECRET')
+        if not key:
+            raise _LocalVerificationUnavailable("SUPABASE_JWT_SECRET not set")
+    elif alg in ('RS256', 'ES256'):
+        try:
+            key = _get_jwks_client().get_signing_key_from_jwt(token).key
+        except jwt.PyJWKClientError as e:
+            raise _LocalVerificationUnavailable(str(e))
+    else:
+        raise _LocalVerificationUnavailable(f"Unsupported token algorithm: {alg}")
+
+    return jwt.decode(
+        token,
+        key,
+        algorithms=[alg],
+        audience='authenticated',
+        options={'require': ['exp', 'sub']},
+    )
+
+
+def _get_cached_user(token_hash: str) -> Optional[str]:
+    """Return the user ID for a recently validated token if it hasn't expired."""
+    with _token_cache_lock:
+        entry = _token_cache.get(token_hash)
+        if not entry:
+            return None
+        user_id, exp = entry
+        if exp <= time.time():
+            del _token_cache[token_hash]
+            return None
+        _token_cache.move_to_end(token_hash)
+        return user_id
+
+
+def _cache_user(token_hash: str, user_id: str, exp: float):
+    with _token_cache_lock:
+        _token_cache[token_hash] = (user_id, exp)
+        _token_cache.move_to_end(token_hash)
+        while len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+
+def _verify_token_remotely(token: str) -> Tuple[str, float]:
+    """Validate the token with Supabase Auth (network round trip)."""
+    user = supabase_service.client.auth.get_user(token)
+    if not user or not user.user:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    try:
+        exp = float(jwt.decode(token, options={'verify_signature': False}).get('exp'))
+    except Exception:
+        exp = time.time() + _FALLBACK_TOKEN_TTL
+    return user.user.id, exp
+
+
+def _report_fallback_once(reason: Exception):
+    global _fallback_reported
+    if not _fallback_reported:
+        _fallback_reported = True
+        print(f"[Auth] Local token verification unavailable, falling back to Supabase Auth: {reason}")
+
 
 async def get_current_user(authorization: Optional[str] = Header(None)) -> str:
     """Extract user ID from Supabase JWT token"""
@@ -12,12 +129,30 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> str:
         raise HTTPException(status_code=401, detail="Invalid authorization format")
 
     token = authorization.replace("Bearer ", "")
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+
+    user_id = _get_cached_user(token_hash)
+    if user_id:
+        return user_id
+
+    # Verify signature and expiry locally against the cached signing keys
+    try:
+        claims = _verify_token_locally(token)
+        _cache_user(token_hash, claims['sub'], float(claims['exp']))
+        return claims['sub']
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Authentication failed: token has expired")
+    except jwt.InvalidTokenError as e:
+        raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
+    except _LocalVerificationUnavailable as e:
+        _report_fallback_once(e)
 
     try:
         # Verify token with Supabase
-        user = supabase_service.client.auth.get_user(token)
-        if not user or not user.user:
-            raise HTTPException(status_code=401, detail="Invalid token")
-        return user.user.id
+        user_id, exp = _verify_token_remotely(token)
+        _cache_user(token_hash, user_id, exp)
+        return user_id
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
@@ -1,19 +1,41 @@
-from typing import List
+import itertools
+import threading
+from typing import Dict, List, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Body, Depends
 from briefing.supabase_service import supabase_service
-from briefing.sports_fetcher import SportsFetcher
+from briefing.background import run_in_background
+from briefing.sports_fetcher import SportsFetcher, get_sports_fetcher
 from .auth import get_current_user
 from .models import Bet
 
 router = APIRouter(prefix="/api/bets", tags=["bets"])
 
-sports_fetcher = SportsFetcher()
+# Once a game is over a prop's outcome can't change
+_FINAL_PROP_STATUSES = ('won', 'lost', 'push')
+_LIVE_STATE_FIELDS = ('current_value', 'current_value_str', 'game_state', 'game_status_text', 'prop_status')
+_STORED_GAME_STATES = ('pre', 'in', 'post')  # game_state CHECK constraint
+
+# Live state write-back: at most one save per user and table per interval, unless something settled
+_LIVE_STATE_WRITE_INTERVAL = 30  # seconds
+_pending_live_state: Dict[Tuple[str, str], Dict[str, dict]] = {}  # {(user_id, table): {row id: row}}
+_live_state_writers: Dict[Tuple[str, str], threading.Event] = {}  # {(user_id, table): wake-up for a settled row}
+_live_state_write_lock = threading.Lock()
+_live_state_writer_ids = itertools.count()
 
 
 @router.get("")
-def get_bets(user_id: str = Depends(get_current_user)):
-    """Get all bets and stats for the authenticated user"""
-    bets = supabase_service.get_bets(user_id)
+def get_bets(user_id: str = Depends(get_current_user), fields: Optional[str] = None):
+    """
+    Get all bets and stats for the authenticated user.
+    fields: comma-separated bet fields to return (e.g. "id,status,stake,legs"); all when omitted.
+    """
+    field_list = None
+    if fields:
+        field_list = [f.strip() for f in fields.split(',') if f.strip()]
+        unknown = [f for f in field_list if f not in supabase_service.BET_FIELDS and f != 'legs']
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown bet fields: {', '.join(unknown)}")
+    bets = supabase_service.get_bets(user_id, field_list)
     stats = supabase_service.get_user_stats(user_id)
     return {"bets": bets, "stats": stats}
 
@@ -57,6 +79,84 @@ def delete_bet(bet_id: str, user_id: str = Depends(get_current_user)):
     return {"success": True, "message": "Bet deleted successfully"}
 
 
+def _is_settled(item: dict) -> bool:
+    """True if a bet or leg's game is over and its final outcome is known."""
+    return item.get('game_state') == 'post' and item.get('prop_status') in _FINAL_PROP_STATUSES
+
+
+def _live_state(item: dict) -> dict:
+    return {field: item.get(field) for field in _LIVE_STATE_FIELDS}
+
+
+def _live_state_row(stored: dict, refreshed: dict) -> Optional[dict]:
+    """
+    Row to write back for a refreshed bet or leg, or None if its stored state is
+    already current (or the refresh couldn't determine the game state).
+    """
+    if not stored.get('id') or refreshed.get('game_state') not in _STORED_GAME_STATES:
+        return None
+    values = _live_state(refreshed)
+    if values == _live_state(stored):
+        return None
+    row = {'id': stored['id'], **values}
+    if refreshed.get('is_combined'):
+        row['combined_players'] = refreshed.get('combined_players')
+    return row
+
+
+def _live_state_writer(user_id: str, table: str, wake: threading.Event):
+    """
+    Save the user's pending rows for `table`, then wait out the write interval
+    (cut short by a newly settled row) and save what accumulated meanwhile.
+    Exits, dropping its keys, once an interval passes without new rows.
+    """
+    key = (user_id, table)
+    while True:
+        with _live_state_write_lock:
+            wake.clear()
+            rows = list(_pending_live_state.pop(key, {}).values())
+            if not rows:
+                del _live_state_writers[key]
+                return
+        try:
+            if table == 'bets':
+                supabase_service.save_live_state(user_id, rows, [])
+            else:
+                supabase_service.save_live_state(user_id, [], rows)
+        except Exception as e:
+            print(f"Error saving live state for {len(rows)} {table}: {e}")
+        wake.wait(_LIVE_STATE_WRITE_INTERVAL)
+
+
+def _write_live_state(user_id: str, table: str, rows: List[dict]):
+    """
+    Persist refreshed live state for a user's bets or legs ('bets' / 'legs').
+
+    Rows are merged by id into a pending batch per user and table, which one
+    background writer saves at most every _LIVE_STATE_WRITE_INTERVAL. A newly
+    settled row is saved right away so settled bets stop refreshing.
+    """
+    if not rows:
+        return
+
+    key = (user_id, table)
+    with _live_state_write_lock:
+        _pending_live_state.setdefault(key, {}).update({row['id']: row for row in rows})
+        wake = _live_state_writers.get(key)
+        if wake is not None:
+            if any(_is_settled(row) for row in rows):
+                wake.set()
+            return
+        wake = _live_state_writers[key] = threading.Event()
+
+    # Written off the request path; the response already carries the fresh values.
+    # Writers are unique per key through _live_state_writers, so task names only need to be distinct.
+    run_in_background(
+        f"live-state-{table}-{user_id}-{next(_live_state_writer_ids)}",
+        lambda: _live_state_writer(user_id, table, wake),
+    )
+
+
 def _refresh_combined_prop(leg: dict, sport: str, fetcher: SportsFetcher) -> dict:
     """
     Refresh a combined prop bet (e.g., "Smith + Barkley + Brown Over 4 TDs Combined").
@@ -174,29 +274,63 @@ def _refresh_combined_prop(leg: dict, sport: str, fetcher: SportsFetcher) -> dic
     }
 
 
+def _normalize_games(items: List[dict], games: Dict[str, dict]):
+    """
+    Move each refreshed bet or leg's game block (live_situation, last_play) into
+    `games`, keyed by event_id. Items on the same game share one entry and keep
+    only their event_id as the reference.
+    """
+    for item in items:
+        live_situation = item.pop('live_situation', None)
+        last_play = item.pop('last_play', None)
+        event_id = item.get('event_id')
+        if not event_id or (live_situation is None and last_play is None):
+            continue
+        game = games.setdefault(str(event_id), {'live_situation': None, 'last_play': None})
+        if game['live_situation'] is None:
+            game['live_situation'] = live_situation
+        if game['last_play'] is None:
+            game['last_play'] = last_play
+
+
 @router.post("/refresh-props")
-def refresh_props(bet_ids: List[str] = Body(...), user_id: str = Depends(get_current_user)):
+def refresh_props(bet_ids: List[str] = Body(...), normalize: bool = False, user_id: str = Depends(get_current_user)):
     """
     Refresh live stats for player props and return updated bet data.
+
+    With normalize=true each game's live_situation and last_play are returned
+    once in a `games` map keyed by event_id, and bets reference it by event_id.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         from briefing.props_dashboard import PropsDashboard
 
         # Get user's bets from Supabase
         all_bets = supabase_service.get_bets(user_id)
         updated_bets = []
+        live_state_rows = []
 
         # Filter for the requested bet IDs that support live tracking
         target_bets = [b for b in all_bets if b.get('id') in bet_ids and b.get('type') in ['Prop', '1st Half', '1st Quarter', 'Team Total', 'Moneyline', 'Spread', 'Total']]
 
         if not target_bets:
-            return {"bets": []}
+            return {"bets": [], "games": {}} if normalize else {"bets": []}
 
         # Group by sport, separating combined props from regular props
         by_sport = {}
         combined_bets = []  # Combined props need special handling
 
         for bet in target_bets:
+            # Settled bets are returned as stored, without refetching their game
+            if _is_settled(bet):
+                updated_bets.append({
+                    'id': bet['id'],
+                    **_live_state(bet),
+                    'last_play': None,
+                    'live_situation': None,
+                })
+                continue
+
             sport = bet.get('sport', 'nfl').lower()
 
             # Check if this is a combined prop bet
@@ -211,14 +345,13 @@ def refresh_props(bet_ids: List[str] = Body(...), user_id: str = Depends(get_cur
         for sport, sport_bets in by_sport.items():
             dashboard = PropsDashboard(sport=sport)
 
+            # Skip if no valid event_id (keeps dashboard.props aligned with sport_bets)
+            sport_bets = [bet for bet in sport_bets if bet.get('event_id')]
+
             # Convert bets to props
             for bet in sport_bets:
                 event_id = bet.get('event_id')
 
-                # Skip if no valid event_id
-                if not event_id:
-                    continue
-
                 # Add prop to dashboard
                 dashboard.add_prop(
                     game_id=str(event_id),
@@ -255,6 +388,7 @@ def refresh_props(bet_ids: List[str] = Body(...), user_id: str = Depends(get_cur
                         'live_situation': prop.live_situation,  # Rich live game data
                     }
                     updated_bets.append(bet_data)
+                    live_state_rows.append(_live_state_row(sport_bets[i], bet_data))
 
         # Refresh combined prop bets
         for sport, bet in combined_bets:
@@ -281,11 +415,22 @@ def refresh_props(bet_ids: List[str] = Body(...), user_id: str = Depends(get_cur
                     'combined_players': updated_leg.get('combined_players'),
                 }
                 updated_bets.append(bet_data)
+                live_state_rows.append(_live_state_row(bet, bet_data))
             except Exception as e:
                 print(f"Error refreshing combined prop bet {bet.get('id')}: {str(e)}")
                 import traceback
                 traceback.print_exc()
 
+        _write_live_state(user_id, 'bets', [row for row in live_state_rows if row])
+
+        if normalize:
+            event_ids = {bet['id']: bet.get('event_id') for bet in target_bets}
+            for bet_data in updated_bets:
+                bet_data['event_id'] = event_ids.get(bet_data['id'])
+            games = {}
+            _normalize_games(updated_bets, games)
+            return {"bets": updated_bets, "games": games}
+
         return {"bets": updated_bets}
 
     except Exception as e:
@@ -296,11 +441,14 @@ def refresh_props(bet_ids: List[str] = Body(...), user_id: str = Depends(get_cur
 
 
 @router.post("/refresh-parlay-legs")
-def refresh_parlay_legs(bet_ids: List[str] = Body(...), user_id: str = Depends(get_current_user)):
+def refresh_parlay_legs(bet_ids: List[str] = Body(...), normalize: bool = False, user_id: str = Depends(get_current_user)):
     """
     Refresh live stats for parlay legs and return updated leg data.
     Each parlay's legs are refreshed individually.
+
+    With normalize=true legs reference a shared `games` map by event_id (see refresh_props).
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         from briefing.props_dashboard import PropsDashboard
 
@@ -309,6 +457,7 @@ def refresh_parlay_legs(bet_ids: List[str] = Body(...), user_id: str = Depends(g
         # Get user's bets from Supabase
         all_bets = supabase_service.get_bets(user_id)
         updated_parlays = []
+        live_state_rows = []
 
         # Filter for parlays with the requested bet IDs
         parlay_bets = [b for b in all_bets if b.get('id') in bet_ids and b.get('type') == 'Parlay']
@@ -316,7 +465,7 @@ def refresh_parlay_legs(bet_ids: List[str] = Body(...), user_id: str = Depends(g
 
         if not parlay_bets:
             print("[RefreshParlayLegs] No parlays found, returning empty")
-            return {"parlays": []}
+            return {"parlays": [], "games": {}} if normalize else {"parlays": []}
 
         for parlay in parlay_bets:
             legs = parlay.get('legs', [])
@@ -348,8 +497,8 @@ def refresh_parlay_legs(bet_ids: List[str] = Body(...), user_id: str = Depends(g
 
                 for idx, leg in sport_legs:
                     event_id = leg.get('event_id')
-                    if not event_id:
-                        # No event_id, skip but preserve original leg
+                    if not event_id or _is_settled(leg):
+                        # No event_id or already settled: preserve the stored leg without refetching
                         updated_legs.append((idx, leg))
                         continue
 
@@ -400,6 +549,7 @@ def refresh_parlay_legs(bet_ids: List[str] = Body(...), user_id: str = Depends(g
                             'live_situation': prop.live_situation,
                         }
                         updated_legs.append((idx, updated_leg))
+                        live_state_rows.append(_live_state_row(leg, updated_leg))
                         prop_idx += 1
 
                 # Process combined props separately
@@ -407,6 +557,7 @@ def refresh_parlay_legs(bet_ids: List[str] = Body(...), user_id: str = Depends(g
                     try:
                         updated_leg = _refresh_combined_prop(leg, sport, sports_fetcher)
                         updated_legs.append((idx, updated_leg))
+                        live_state_rows.append(_live_state_row(leg, updated_leg))
                     except Exception as e:
                         print(f"Error refreshing combined prop: {str(e)}")
                         import traceback
@@ -432,7 +583,17 @@ def refresh_parlay_legs(bet_ids: List[str] = Body(...), user_id: str = Depends(g
                 'legs': final_legs
             })
 
+        _write_live_state(user_id, 'legs', [row for row in live_state_rows if row])
+
         print(f"[RefreshParlayLegs] Returning {len(updated_parlays)} updated parlays")
+        if normalize:
+            games = {}
+            for parlay in updated_parlays:
+                # Copies: unrefreshed legs are the stored leg dicts themselves
+                parlay['legs'] = [dict(leg) for leg in parlay['legs']]
+                _normalize_games(parlay['legs'], games)
+            return {"parlays": updated_parlays, "games": games}
+
         return {"parlays": updated_parlays}
 
     except Exception as e:
@@ -0,0 +1,83 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import APIRouter, Depends
+from .auth import get_current_user
+from .models import FavoriteTeam
+from . import bets, pinned_games, teams
+
+router = APIRouter(prefix="/api/bootstrap", tags=["bootstrap"])
+
+
+def _timed(fn, *args) -> dict:
+    """Run one bootstrap section, capturing its result, error and duration."""
+    start = time.perf_counter()
+    section = {'data': None, 'error': None}
+    try:
+        section['data'] = fn(*args)
+    except Exception as e:
+        detail = getattr(e, 'detail', None)
+        section['error'] = detail if detail else str(e)
+        print(f"[Bootstrap] Error in {getattr(fn, '__name__', fn)}: {section['error']}")
+    section['ms'] = round((time.perf_counter() - start) * 1000, 1)
+    return section
+
+
+def _favorites_with_results(user_id: str) -> tuple:
+    """Load favorite teams, then their latest/next games (results depend on the list)."""
+    favorites = _timed(teams.get_favorite_teams, user_id)
+    favorite_teams = [
+        FavoriteTeam(id=t['id'], name=t['name'], sport=t['sport'])
+        for t in (favorites['data'] or [])
+    ]
+    if favorite_teams:
+        results = _timed(teams.get_favorite_teams_results, favorite_teams)
+    else:
+        results = {'data': [], 'error': favorites['error'], 'ms': 0.0}
+    return favorites, results
+
+
+@router.get("")
+def get_bootstrap(user_id: str = Depends(get_current_user)):
+    """
+    Get everything the app needs on launch in one authenticated call.
+    Bets, pinned games and favorite teams are loaded concurrently; each section
+    reports its own error and timing so one slow or failing read doesn't sink the rest.
+    """
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        bets_future = executor.submit(_timed, bets.get_bets, user_id)
+        pinned_future = executor.submit(_timed, pinned_games.get_pinned_games, user_id)
+        favorites_future = executor.submit(_favorites_with_results, user_id)
+
+        bets_section = bets_future.result()
+        pinned_section = pinned_future.result()
+        favorites_section, results_section = favorites_future.result()
+
+    bets_data = bets_section['data'] or {}
+    pinned_data = pinned_section['data'] or {}
+
+    return {
+        'bets': bets_data.get('bets', []),
+        'stats': bets_data.get('stats'),
+        'pinned_games': pinned_data.get('pinned_games', []),
+        'favorite_teams': favorites_section['data'] or [],
+        'favorite_teams_results': results_section['data'] or [],
+        'errors': {
+            name: section['error']
+            for name, section in (
+                ('bets', bets_section),
+                ('pinned_games', pinned_section),
+                ('favorite_teams', favorites_section),
+                ('favorite_teams_results', results_section),
+            )
+            if section['error']
+        },
+        'timing': {
+            'bets': bets_section['ms'],
+            'pinned_games': pinned_section['ms'],
+            'favorite_teams': favorites_section['ms'],
+            'favorite_teams_results': results_section['ms'],
+            'total': round((time.perf_counter() - start) * 1000, 1),
+        },
+    }
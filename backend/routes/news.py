@@ -1,24 +1,145 @@
-from typing import List, Optional
+import time
+from functools import partial
+from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from briefing.news_fetcher import NewsFetcher
+from briefing.news_store import get_news_store
+from briefing.search_index import get_search_index
+from briefing.background import run_periodically
 from briefing.config import Config
 
 router = APIRouter(prefix="/api/news", tags=["news"])
 
-config = Config()
-news_fetcher = NewsFetcher()
+_config: Optional[Config] = None
+_news_fetcher: Optional[NewsFetcher] = None
+
+_NEWS_POLL_INTERVAL = 300  # 5 minutes in seconds
+_NEWS_POLL_ITEMS = 20  # items ingested per poll; /api/news still lists 10 per source
+
+
+def _get_config() -> Config:
+    """Load the config on first use (it creates the config directory on disk)."""
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
+
+
+def _get_news_fetcher() -> NewsFetcher:
+    global _news_fetcher
+    if _news_fetcher is None:
+        _news_fetcher = NewsFetcher()
+    return _news_fetcher
+
+
+def _poll_source(source: str):
+    """Fetch one default source and add its items to the news store."""
+    store = get_news_store()
+    try:
+        items = _get_news_fetcher().fetch_feed(NewsFetcher.DEFAULT_FEEDS[source], limit=_NEWS_POLL_ITEMS)
+    except Exception as e:
+        print(f"[News] Error polling {source}: {e}")
+        store.record_error(source, str(e))
+        return
+    added = store.ingest(source, items)
+    if added:
+        print(f"[News] {source}: {added} new articles")
+
+
+def _ensure_ingested(sources: List[str]):
+    """
+    Make sure default sources are in the news store and polled in the background.
+    Sources read for the first time are fetched now, concurrently; after that
+    every source is refreshed by its own poller and reads never go upstream.
+    """
+    store = get_news_store()
+    missing = [source for source in sources if not store.has_source(source)]
+    if missing:
+        results, status = _get_news_fetcher().fetch_feeds_with_status(missing, limit=_NEWS_POLL_ITEMS)
+        for source in missing:
+            if status.get(source, {}).get('status') == 'ok':
+                store.ingest(source, results[source])
+            else:
+                store.record_error(source, status.get(source, {}).get('error') or 'timeout')
+
+    for source in sources:
+        run_periodically(f'news-poller-{source}', _NEWS_POLL_INTERVAL, partial(_poll_source, source),
+                         initial_delay=_NEWS_POLL_INTERVAL)
 
 
 @router.get("")
-def get_news(sources: Optional[List[str]] = Query(None)):
+def get_news(
+    sources: Optional[List[str]] = Query(None),
+    include_status: bool = False,
+    dedupe: bool = False,
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+):
+    """
+    Get the latest items per source, served from the background-polled news store.
+
+    dedupe: drop items already listed under an earlier source (the same wire story).
+    include_status: return {'news': {...}, 'status': {source: {'status': ...}}}.
+    since: return {'items': [...], 'cursor': int} with only the stories that arrived
+        after the given cursor (0 for everything stored), one item per story with
+        all sources that carried it. Pass the returned cursor on the next call.
+    """
     try:
         if not sources:
-            sources = config.get('news.default_sources', ['bbc', 'cnn'])
-        return news_fetcher.fetch_multiple_feeds(sources)
+            sources = _get_config().get('news.default_sources', ['bbc', 'cnn'])
+        known = [source.lower() for source in sources if source.lower() in NewsFetcher.DEFAULT_FEEDS]
+        custom = [source for source in sources if source.lower() not in NewsFetcher.DEFAULT_FEEDS]
+
+        _ensure_ingested(known)
+        store = get_news_store()
+
+        if since is not None:
+            return store.since(since, known, limit)
+
+        # Custom feed URLs aren't polled, so they are still fetched on request
+        custom_results, custom_status = _get_news_fetcher().fetch_feeds_with_status(custom) if custom else ({}, {})
+
+        results: Dict[str, List[Dict]] = {}
+        status: Dict[str, Dict] = {}
+        seen_clusters = set() if dedupe else None
+        for source in known:
+            results[source] = store.latest(source, exclude_clusters=seen_clusters)
+            status[source] = store.status(source) or {'status': 'error'}
+        results.update(custom_results)
+        status.update(custom_status)
+
+        if include_status:
+            return {'news': results, 'status': status}
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search")
+def search_news(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    source: Optional[str] = None,
+):
+    """
+    Full-text search over ingested news: the polled RSS sources and ESPN sports
+    news (sources 'espn-<sport>'). Results are ranked by BM25, best first.
+    """
+    try:
+        # Searching shouldn't depend on someone having read /api/news first
+        _ensure_ingested([s.lower() for s in _get_config().get('news.default_sources', ['bbc', 'cnn'])
+                          if s.lower() in NewsFetcher.DEFAULT_FEEDS])
+        start = time.perf_counter()
+        results = get_search_index().search(q, limit=limit, source=source.lower() if source else None)
+        return {
+            'query': q,
+            'results': results,
+            'took_ms': round((time.perf_counter() - start) * 1000, 2),
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/sources")
 def get_news_sources():
-    return news_fetcher.list_default_sources()
+    return NewsFetcher.list_default_sources()
@@ -1,20 +1,95 @@
+from datetime import datetime
+from typing import Dict, List, Set
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException, Body, Depends
 from briefing.supabase_service import supabase_service
+from briefing.sports_fetcher import get_sports_fetcher
+from briefing.background import run_periodically
 from .auth import get_current_user
 from .models import PinGameRequest
 
 router = APIRouter(prefix="/api/pinned-games", tags=["pinned-games"])
 
+_PINNED_GAMES_SWEEP_INTERVAL = 300  # 5 minutes in seconds
+
+
+def _find_ended_events(sport: str, event_ids: Set[str]) -> List[str]:
+    """
+    Return the events of one sport that are final.
+    The sport's scoreboard is fetched once; events no longer on it are checked
+    through their summary, which is served from the finished-game cache once final.
+    """
+    sports_fetcher = get_sports_fetcher()
+
+    by_id = {}
+    try:
+        for score in sports_fetcher.fetch_scores(sport, 100, date=None):
+            for key in (score.get("competition_id"), score.get("event_id")):
+                if key:
+                    by_id.setdefault(str(key), score)
+    except Exception as e:
+        print(f"[PinnedGames] Error fetching {sport} scoreboard: {e}")
+
+    ended = []
+    for event_id in event_ids:
+        score = by_id.get(event_id)
+        try:
+            if score is not None:
+                is_final = score.get("state") == "post"
+            elif sport.startswith("tennis"):
+                league = 'wta' if 'wta' in sport else 'atp'
+                is_final = bool(sports_fetcher.fetch_tennis_match_details(league, event_id).get("completed"))
+            elif sport in sports_fetcher.SOCCER_LEAGUE_PATHS:
+                is_final = sports_fetcher.fetch_soccer_game_stats(sport, event_id).get("_game_state") == "post"
+            elif sport in sports_fetcher.SPORTS:
+                is_final = sports_fetcher._fetch_game_summary(sport, event_id).get("_game_state") == "post"
+            else:
+                # No summary endpoint (e.g. F1): only the scoreboard can end it
+                continue
+        except Exception as e:
+            print(f"[PinnedGames] Error checking {sport}/{event_id}: {e}")
+            continue
+        if is_final:
+            ended.append(event_id)
+    return ended
+
+
+def sweep_pinned_games():
+    """
+    Record game_end_time for pinned games that are final and delete pins that
+    expired, for all users in one batched statement each.
+    """
+    pins = supabase_service.get_unended_pinned_games()
+
+    events_by_sport: Dict[str, Set[str]] = {}
+    for pin in pins:
+        events_by_sport.setdefault((pin.get("sport") or "").lower(), set()).add(str(pin["event_id"]))
+    events_by_sport.pop("", None)
+
+    ended = []
+    if events_by_sport:
+        with ThreadPoolExecutor(max_workers=min(4, len(events_by_sport))) as executor:
+            for sport_ended in executor.map(lambda item: _find_ended_events(*item), events_by_sport.items()):
+                ended.extend(sport_ended)
+
+    marked = supabase_service.mark_pinned_games_ended(ended, datetime.utcnow().isoformat()) if ended else 0
+    cleaned = supabase_service.cleanup_ended_games()
+    if marked or cleaned:
+        print(f"[PinnedGames] Marked {marked} pins as ended, removed {cleaned} expired pins")
+
+
+def start_pinned_games_sweeper():
+    """Sweep ended and expired pinned games every 5 minutes in the background."""
+    run_periodically('pinned-games-sweeper', _PINNED_GAMES_SWEEP_INTERVAL, sweep_pinned_games, initial_delay=30)
+
 
 @router.get("")
 def get_pinned_games(user_id: str = Depends(get_current_user)):
-    """Get all pinned games for the current user"""
+    """
+    Get all pinned games for the current user.
+    Expired games are filtered out here and deleted by the background sweeper.
+    """
     try:
-        # First cleanup any expired pinned games
-        cleaned = supabase_service.cleanup_ended_games(user_id)
-        if cleaned > 0:
-            print(f"[PinnedGames] Auto-cleaned {cleaned} expired games for user {user_id}")
-
         games = supabase_service.get_pinned_games(user_id)
         return {"pinned_games": games}
     except Exception as e:
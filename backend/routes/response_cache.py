@@ -0,0 +1,247 @@
+"""
+Micro-cache of serialized responses for public GET endpoints.
+
+Endpoints without a per-user component return the same document to every
+caller, so the serialized body is kept per (endpoint, normalized query) and
+identical requests within its TTL skip fetching, shaping and serialization.
+Other representations (MessagePack, brotli/gzip) are encoded once on first
+demand and reused.
+
+The TTL is derived from the response itself, so a live game is cached for
+seconds while a finished one is cached for an hour.
+
+Responses also carry HTTP validators: a content-hash ETag and a Cache-Control
+max-age, and a request whose If-None-Match matches gets a 304 without a body.
+conditional_response adds just these HTTP semantics to endpoints that aren't
+worth caching server-side.
+"""
+
+import json
+import hashlib
+import time
+import inspect
+import functools
+import threading
+from typing import Any, Callable, Dict, Optional, Union
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from briefing.cache import MemoryBackend
+from .responses import (
+    COMPRESS_MIN_SIZE, MSGPACK_MEDIA_TYPE, choose_encoding, compress, dumps_json, dumps_msgpack, loads_json, wants_msgpack,
+)
+
+_CACHE_SIZE = 512
+
+_LIVE_TTL = 10
+_UPCOMING_TTL = 60
+_FINAL_TTL = 3600
+
+# Query parameters whose case doesn't matter (sport codes)
+_CASE_INSENSITIVE_PARAMS = ('sport', 'sports')
+
+_responses = MemoryBackend(_CACHE_SIZE)  # {key: {'body', 'etag', 'timestamp', 'ttl', 'variants'}}
+_ttl_override = threading.local()  # set by an endpoint during its own call, see set_response_ttl
+
+
+def games_ttl(games: Any) -> float:
+    """TTL for a list of games: short while any is live, long once all are final, 0 for error placeholders."""
+    states = {game.get('state') for game in games if isinstance(game, dict)} if isinstance(games, list) else set()
+    if 'error' in states:
+        return 0
+    if 'in' in states:
+        return _LIVE_TTL
+    if states and states <= {'post'}:
+        return _FINAL_TTL
+    return _UPCOMING_TTL
+
+
+def game_ttl(game: Any) -> float:
+    """TTL for a single game document (box score, tennis match)."""
+    if not isinstance(game, dict):
+        return 0
+    state = game.get('game_state') or game.get('state')
+    if state == 'in':
+        return _LIVE_TTL
+    if state == 'post' or game.get('completed'):
+        return _FINAL_TTL
+    return _UPCOMING_TTL
+
+
+def set_response_ttl(ttl: float):
+    """
+    Set the TTL of the response being built from inside a cached_response
+    endpoint, for when the fields the ttl function reads were projected away.
+    """
+    _ttl_override.value = ttl
+
+
+def _cache_key(name: str, params: Dict[str, Any]) -> str:
+    normalized = {
+        key: value.lower() if key in _CASE_INSENSITIVE_PARAMS and isinstance(value, str) else value
+        for key, value in params.items()
+        if key != 'request'
+    }
+    return f"{name}?{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+def _serialize(result: Any) -> bytes:
+    return dumps_json(jsonable_encoder(result))
+
+
+def _etag(body: bytes) -> str:
+    # Weak: the compressed and MessagePack representations of a body share the tag
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match already matches the current ETag (weak comparison)."""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    tag = etag[2:] if etag.startswith('W/') else etag
+    return any(
+        (candidate[2:] if candidate.startswith('W/') else candidate) == tag
+        for candidate in (part.strip() for part in if_none_match.split(','))
+    )
+
+
+def _cache_control(max_age: float, stale_while_revalidate: Optional[float], private: bool) -> str:
+    if private:
+        # Per-user data: browsers may keep it but must revalidate, shared caches must not store it
+        return 'private, no-cache'
+    if max_age <= 0:
+        return 'no-cache'
+    swr = int(max_age if stale_while_revalidate is None else stale_while_revalidate)
+    return f'public, max-age={int(max_age)}, stale-while-revalidate={swr}'
+
+
+def _to_response(entry: Dict, request: Request, cache_control: str, hit: Optional[bool] = None) -> Response:
+    headers = {'ETag': entry['etag'], 'Cache-Control': cache_control, 'Vary': 'Accept, Accept-Encoding'}
+    if hit is not None:
+        headers['X-Cache'] = 'HIT' if hit else 'MISS'
+    if _not_modified(request, entry['etag']):
+        return Response(status_code=304, headers=headers)
+
+    # Each negotiated representation is encoded once per entry and reused
+    media_type = MSGPACK_MEDIA_TYPE if wants_msgpack(request.headers.get('accept', '')) else 'application/json'
+    encoding = choose_encoding(request.headers.get('accept-encoding', ''))
+    if len(entry['body']) < COMPRESS_MIN_SIZE:
+        encoding = None
+    variants = entry.setdefault('variants', {})
+    body = variants.get((media_type, encoding))
+    if body is None:
+        body = entry['body'] if media_type == 'application/json' else dumps_msgpack(loads_json(entry['body']))
+        if encoding:
+            body = compress(body, encoding, best=True)
+        variants[(media_type, encoding)] = body
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def _wrap_endpoint(fn: Callable, handle: Callable) -> Callable:
+    """
+    Wrap an endpoint so handle(request, call, kwargs) produces its response.
+
+    FastAPI reads the signature to build the endpoint's parameters, so the
+    wrapper exposes the original parameters plus the request it needs. Direct
+    calls without a request (e.g. from /api/bootstrap) get the plain result.
+    """
+    signature = inspect.signature(fn)
+    wants_request = 'request' in signature.parameters
+
+    @functools.wraps(fn)
+    def wrapper(*args, request: Optional[Request] = None, **kwargs):
+        if request is None:
+            return fn(*args, **kwargs)
+
+        def call():
+            return fn(*args, request=request, **kwargs) if wants_request else fn(*args, **kwargs)
+        return handle(request, call, kwargs)
+
+    if not wants_request:
+        parameters = list(signature.parameters.values()) + [
+            inspect.Parameter('request', inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+        ]
+        signature = signature.replace(parameters=parameters)
+    wrapper.__signature__ = signature
+    return wrapper
+
+
+def _resolve_ttl(ttl: Union[float, Callable[[Any], float]], result: Any) -> float:
+    return ttl(result) if callable(ttl) else ttl
+
+
+def cached_response(ttl: Union[float, Callable[[Any], float]], stale_while_revalidate: Optional[float] = None):
+    """
+    Cache a public GET endpoint's serialized response, served with an ETag and
+    a Cache-Control max-age of its remaining freshness.
+
+    Args:
+        ttl: Seconds to keep a response, or a function of the endpoint's result
+            returning them (0 means don't cache). Exceptions are never cached.
+        stale_while_revalidate: Seconds clients/CDNs may serve it stale while
+            revalidating (defaults to the TTL)
+    """
+    def decorator(fn: Callable) -> Callable:
+        def handle(request: Request, call: Callable, kwargs: Dict) -> Response:
+            key = _cache_key(fn.__name__, kwargs)
+            entry = _responses.get(key)
+            now = time.time()
+            if entry and now - entry['timestamp'] < entry['ttl']:
+                max_age = entry['ttl'] - (now - entry['timestamp'])
+                swr = entry['ttl'] if stale_while_revalidate is None else stale_while_revalidate
+                return _to_response(entry, request, _cache_control(max_age, swr, False), hit=True)
+
+            # Endpoints run synchronously on this thread, so an override set during call() is theirs
+            _ttl_override.value = None
+            result = call()
+            if isinstance(result, Response):
+                return result
+            override, _ttl_override.value = _ttl_override.value, None
+
+            body = _serialize(result)
+            entry_ttl = override if override is not None else _resolve_ttl(ttl, result)
+            entry = {'body': body, 'etag': _etag(body), 'timestamp': now, 'ttl': entry_ttl}
+            if entry['ttl'] > 0:
+                _responses.set(key, entry)
+            return _to_response(entry, request, _cache_control(entry['ttl'], stale_while_revalidate, False), hit=False)
+
+        return _wrap_endpoint(fn, handle)
+
+    return decorator
+
+
+def conditional_response(
+    max_age: Union[float, Callable[[Any], float]] = 0,
+    stale_while_revalidate: Optional[float] = None,
+    private: bool = False,
+):
+    """
+    Serve a GET endpoint's response with an ETag and Cache-Control, answering
+    a matching If-None-Match with 304 and no body. The endpoint still runs on
+    every request (use cached_response to skip that too).
+
+    Args:
+        max_age: Seconds clients/CDNs may reuse the response, or a function of the result
+        stale_while_revalidate: Seconds it may be served stale while revalidating (defaults to max_age)
+        private: Per-user response - 'private, no-cache', revalidated on every use
+    """
+    def decorator(fn: Callable) -> Callable:
+        def handle(request: Request, call: Callable, kwargs: Dict) -> Response:
+            result = call()
+            if isinstance(result, Response):
+                return result
+            body = _serialize(result)
+            entry = {'body': body, 'etag': _etag(body)}
+            cache_control = _cache_control(_resolve_ttl(max_age, result), stale_while_revalidate, private)
+            response = _to_response(entry, request, cache_control)
+            if private:
+                response.headers['Vary'] = 'Accept, Accept-Encoding, Authorization'
+            return response
+
+        return _wrap_endpoint(fn, handle)
+
+    return decorator
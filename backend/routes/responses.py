@@ -0,0 +1,150 @@
+"""
+Response encoding: fast JSON, MessagePack and compression.
+
+orjson serializes the default JSON responses when it is installed (falling
+back to the stdlib encoder). Clients that send `Accept: application/msgpack`
+get MessagePack instead of JSON, and bodies above a size threshold are
+compressed with brotli or gzip according to Accept-Encoding.
+
+msgpack and brotli are optional; without them those encodings are simply
+never negotiated.
+"""
+
+import gzip
+import json
+from typing import Any, Optional
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib encoder is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional, responses stay JSON
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:  # optional, gzip is used instead
+    brotli = None
+
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+_MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, 'application/x-msgpack')
+COMPRESS_MIN_SIZE = 1024  # bytes; smaller bodies aren't worth compressing
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize JSON-compatible content to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode()
+
+
+def loads_json(body: bytes) -> Any:
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def dumps_msgpack(content: Any) -> bytes:
+    return msgpack.packb(content, use_bin_type=True)
+
+
+def wants_msgpack(accept: str) -> bool:
+    """True if the Accept header asks for MessagePack and it can be produced."""
+    return msgpack is not None and any(media_type in accept for media_type in _MSGPACK_MEDIA_TYPES)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick 'br' or 'gzip' from an Accept-Encoding header, or None."""
+    accepted = {part.split(';')[0].strip().lower() for part in accept_encoding.split(',')}
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """
+    Compress a body for Content-Encoding `encoding`.
+
+    Args:
+        best: Use a higher level, for bodies that are compressed once and served many times
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=9 if best else 5)
+    return gzip.compress(body, compresslevel=9 if best else 6)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+class CompressionMiddleware:
+    """
+    Negotiate MessagePack and compress JSON/MessagePack responses.
+
+    Responses that already carry a Content-Encoding (e.g. pre-compressed
+    bodies from the response cache) and other media types pass through.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        to_msgpack = wants_msgpack(request_headers.get('accept', ''))
+        encoding = choose_encoding(request_headers.get('accept-encoding', ''))
+        if not to_msgpack and not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        body_parts = []
+        passthrough = False
+
+        async def send_encoded(message):
+            nonlocal start_message, passthrough
+            if message['type'] == 'http.response.start':
+                headers = Headers(raw=message['headers'])
+                content_type = headers.get('content-type', '')
+                if 'content-encoding' in headers or not content_type.startswith(('application/json', MSGPACK_MEDIA_TYPE)):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if passthrough or message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            body_parts.append(message.get('body', b''))
+            if message.get('more_body', False):
+                return
+
+            body = b''.join(body_parts)
+            headers = MutableHeaders(raw=start_message['headers'])
+            if to_msgpack and body and headers.get('content-type', '').startswith('application/json'):
+                body = dumps_msgpack(loads_json(body))
+                headers['content-type'] = MSGPACK_MEDIA_TYPE
+                headers.add_vary_header('Accept')
+            if encoding and len(body) >= self.minimum_size:
+                body = compress(body, encoding)
+                headers['content-encoding'] = encoding
+                headers.add_vary_header('Accept-Encoding')
+            if 'content-length' in headers or body:
+                headers['content-length'] = str(len(body))
+            await send(start_message)
+            await send({'type': 'http.response.body', 'body': body})
+
+        await self.app(scope, receive, send_encoded)
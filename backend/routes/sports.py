@@ -1,19 +1,25 @@
-from typing import List, Dict, Optional
+import json
+import heapq
+import base64
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException, Query, Body
-from briefing.sports_fetcher import SportsFetcher
+from briefing.sports_fetcher import get_sports_fetcher
+from .response_cache import cached_response, conditional_response, games_ttl, game_ttl, set_response_ttl
 
 router = APIRouter(prefix="/api/sports", tags=["sports"])
 
-sports_fetcher = SportsFetcher()
-
 
 @router.get("/scores")
+@cached_response(games_ttl)
 def get_scores(
     sport: str,
     limit: int = 10,
     live: bool = False,
     date: Optional[str] = Query(None, description="Date in YYYYMMDD format")
 ):
+    sports_fetcher = get_sports_fetcher()
     try:
         if live:
             return sports_fetcher.fetch_live(sport, limit)
@@ -23,11 +29,13 @@ def get_scores(
 
 
 @router.get("/schedule")
+@cached_response(games_ttl)
 def get_schedule(
     sport: str,
     limit: int = 10,
     date: Optional[str] = Query(None, description="Date in YYYYMMDD format")
 ):
+    sports_fetcher = get_sports_fetcher()
     try:
         return sports_fetcher.fetch_schedule(sport, limit, date=date)
     except Exception as e:
@@ -35,27 +43,21 @@ def get_schedule(
 
 
 @router.get("/standings")
+@cached_response(300)
 def get_standings(sport: str):
+    sports_fetcher = get_sports_fetcher()
+    if sport.lower() not in sports_fetcher.STANDINGS_SPORTS:
+        raise HTTPException(status_code=400, detail=f"Standings not supported for {sport}")
     try:
-        sport = sport.lower()
-        if sport == 'nba':
-            return sports_fetcher.fetch_nba_standings()
-        elif sport == 'mlb':
-            return sports_fetcher.fetch_mlb_standings()
-        elif sport == 'f1':
-            return sports_fetcher.fetch_f1_standings()
-        elif sport == 'nfl':
-            return sports_fetcher.fetch_nfl_standings()
-        elif sport in ['soccer', 'epl', 'laliga', 'ucl', 'europa']:
-            return sports_fetcher.fetch_soccer_standings(league=sport)
-        else:
-             raise HTTPException(status_code=400, detail=f"Standings not supported for {sport}")
+        return sports_fetcher.fetch_standings(sport)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/f1/races")
+@conditional_response(3600)
 def get_f1_races():
+    sports_fetcher = get_sports_fetcher()
     try:
         return sports_fetcher.fetch_f1_races()
     except Exception as e:
@@ -63,11 +65,13 @@ def get_f1_races():
 
 
 @router.get("/f1/race/{round_number}")
+@conditional_response(600)
 def get_f1_race_results(round_number: int):
     """
     Get detailed results for a specific F1 race by round number.
     Returns full finishing order with times, positions, and team info.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         return sports_fetcher.fetch_f1_race_results(round_number)
     except Exception as e:
@@ -75,11 +79,13 @@ def get_f1_race_results(round_number: int):
 
 
 @router.get("/boxing/fights")
+@conditional_response(600)
 def get_boxing_fights(limit: int = Query(10, ge=1, le=20)):
     """
     Get upcoming and recent boxing fights.
     Returns fight cards with fighters, date, venue, and results if completed.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         return sports_fetcher.fetch_boxing_fights(limit)
     except Exception as e:
@@ -87,11 +93,13 @@ def get_boxing_fights(limit: int = Query(10, ge=1, le=20)):
 
 
 @router.get("/nfl/week")
+@conditional_response(3600)
 def get_nfl_week(date: Optional[str] = Query(None, description="Date in YYYYMMDD format")):
     """
     Get NFL week information for a given date.
     Returns week number and date range for that week.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         return sports_fetcher.get_nfl_week_info(date)
     except Exception as e:
@@ -99,25 +107,173 @@ def get_nfl_week(date: Optional[str] = Query(None, description="Date in YYYYMMDD
 
 
 @router.get("/list")
+@conditional_response(86400)
 def list_sports():
+    sports_fetcher = get_sports_fetcher()
     return sports_fetcher.list_available_sports()
 
 
 @router.get("/news")
+@cached_response(120)
 def get_sports_news(sport: str, limit: int = 10):
+    sports_fetcher = get_sports_fetcher()
     try:
         return sports_fetcher.fetch_news(sport, limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_NEWS_FEED_MAX_SPORTS = 20
+_NEWS_FEED_ITEMS_PER_SPORT = 50
+
+
+def _news_sort_key(item: Dict) -> Tuple[float, str]:
+    """Order news by publish time, then link so items with the same time have a stable order."""
+    try:
+        published = datetime.fromisoformat(item['published'].replace('Z', '+00:00')).timestamp()
+    except (KeyError, AttributeError, ValueError):
+        published = 0.0
+    return (published, item.get('link') or item.get('title', ''))
+
+
+def _encode_news_cursor(key: Tuple[float, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def _decode_news_cursor(cursor: str) -> Tuple[float, str]:
+    try:
+        published, link = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (float(published), str(link))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/news/feed")
+@conditional_response(120)
+def get_sports_news_feed(
+    sports: str,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+):
+    """
+    Get one news feed for several sports (comma-separated), newest first.
+
+    Sports are fetched in parallel through the shared news cache and merged by
+    publish time; articles carried by more than one sport appear once. A sport
+    that fails is reported in 'status' instead of failing the feed.
+    Pass 'next_cursor' back as `cursor` for the next page.
+    """
+    sport_list = list(dict.fromkeys(s.strip().lower() for s in sports.split(',') if s.strip()))
+    if not sport_list:
+        raise HTTPException(status_code=400, detail="At least one sport is required")
+    if len(sport_list) > _NEWS_FEED_MAX_SPORTS:
+        raise HTTPException(status_code=400, detail=f"At most {_NEWS_FEED_MAX_SPORTS} sports per feed")
+    after = _decode_news_cursor(cursor) if cursor else None
+
+    sports_fetcher = get_sports_fetcher()
+
+    def load(sport: str):
+        try:
+            items = [{**item, 'sport': sport} for item in sports_fetcher.fetch_news(sport, _NEWS_FEED_ITEMS_PER_SPORT)]
+            items.sort(key=_news_sort_key, reverse=True)
+            return items, {'status': 'ok', 'count': len(items)}
+        except Exception as e:
+            print(f"Error fetching {sport} news for feed: {e}")
+            return [], {'status': 'error', 'error': str(e)}
+
+    with ThreadPoolExecutor(max_workers=min(8, len(sport_list))) as executor:
+        loaded = list(executor.map(load, sport_list))
+
+    items = []
+    seen = set()
+    next_cursor = None
+    # k-way merge of the per-sport lists, each already sorted newest first
+    for item in heapq.merge(*(sport_items for sport_items, _ in loaded), key=_news_sort_key, reverse=True):
+        key = _news_sort_key(item)
+        if after is not None and key >= after:
+            continue
+        dedupe_key = item.get('link') or item.get('title')
+        if dedupe_key in seen:
+            continue
+        seen.add(dedupe_key)
+        if len(items) == limit:
+            next_cursor = _encode_news_cursor(_news_sort_key(items[-1]))
+            break
+        items.append(item)
+
+    return {
+        'items': items,
+        'next_cursor': next_cursor,
+        'status': {sport: status for sport, (_, status) in zip(sport_list, loaded)},
+    }
+
+
+_BOXSCORE_FIELDS = ('game_state', 'game_status', 'linescores', 'teams', 'sport')
+_TENNIS_BOXSCORE_FIELDS = (
+    'tournament', 'location', 'round', 'competition_type', 'match_note', 'venue',
+    'status', 'state', 'completed', 'current_set', 'players', 'sport',
+)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[set]:
+    """Comma-separated fields= value as a set (None means all fields)."""
+    if not fields:
+        return None
+    return {field.strip() for field in fields.split(',') if field.strip()}
+
+
+def _check_fields(field_set: Optional[set], allowed: tuple):
+    if field_set is not None and not field_set <= set(allowed):
+        unknown = ', '.join(sorted(field_set - set(allowed)))
+        raise HTTPException(status_code=400, detail=f"Unknown box score fields: {unknown}")
+
+
+class _PlayerFilter:
+    """
+    The box score's player filters: players= keeps the listed player ids or names
+    (comma-separated), top= keeps the first N players of each list (ESPN lists
+    starters first). Both can be combined.
+    """
+
+    def __init__(self, players: Optional[str] = None, top: Optional[int] = None):
+        self.limit = top
+        self.wanted = None
+        if players:
+            self.wanted = {player.strip().lower() for player in players.split(',') if player.strip()}
+
+    def select(self, entries: list) -> list:
+        """Entries (ESPN athlete stat or roster entries) to build, before any are shaped."""
+        if self.wanted is not None:
+            entries = [
+                entry for entry in entries
+                if str(entry.get("athlete", {}).get("id", "")) in self.wanted
+                or entry.get("athlete", {}).get("displayName", "").lower() in self.wanted
+            ]
+        if self.limit is not None:
+            entries = entries[:self.limit]
+        return entries
+
+
 @router.get("/boxscore")
-def get_boxscore(sport: str, event_id: str):
+@cached_response(game_ttl)
+def get_boxscore(
+    sport: str, event_id: str, fields: Optional[str] = None, players: Optional[str] = None, top: Optional[int] = None,
+):
     """
     Get detailed box score for a specific game.
     Returns player stats for both teams and period scores.
     Supports: nba, nfl, mlb, soccer leagues, and tennis
+
+    fields: comma-separated top-level fields to return (e.g. "game_state,linescores");
+        teams and player stats are only built when "teams" is requested.
+    players: comma-separated player ids or names to keep.
+    top: keep only the first N players of each list.
     """
+    if top is not None and top < 1:
+        raise HTTPException(status_code=400, detail="top must be at least 1")
+    sports_fetcher = get_sports_fetcher()
+    field_set = _parse_fields(fields)
+    player_filter = _PlayerFilter(players, top)
     try:
         sport = sport.lower()
 
@@ -135,11 +291,18 @@ def get_boxscore(sport: str, event_id: str):
         # Handle tennis separately - returns different structure
         if sport in tennis_types:
             league = 'wta' if 'wta' in sport else 'atp'
+            _check_fields(field_set, _TENNIS_BOXSCORE_FIELDS)
             result = sports_fetcher.fetch_tennis_match_details(league, event_id)
             if result.get('error'):
                 raise HTTPException(status_code=404, detail=result['error'])
+            if field_set is not None:
+                # The cache TTL depends on the match state, which may be projected away
+                set_response_ttl(game_ttl(result))
+                return {key: value for key, value in result.items() if key in field_set}
             return result
 
+        _check_fields(field_set, _BOXSCORE_FIELDS)
+
         # Fetch raw data based on sport type
         if sport == 'nba':
             raw_data = sports_fetcher.fetch_nba_game_player_stats(event_id)
@@ -177,6 +340,13 @@ def get_boxscore(sport: str, event_id: str):
             "teams": [],
             "sport": sport_type  # Normalized sport type for frontend
         }
+        if field_set is not None:
+            # The cache TTL depends on game_state, which may be projected away
+            set_response_ttl(game_ttl(result))
+            result = {key: value for key, value in result.items() if key in field_set}
+            if "teams" not in field_set:
+                # Skip shaping every player when no team data was asked for
+                return result
 
         # Handle soccer separately (uses rosters instead of boxscore.players)
         if sport_type == 'soccer':
@@ -194,7 +364,7 @@ def get_boxscore(sport: str, event_id: str):
                 }
 
                 players = roster.get("roster", [])
-                for player in players:
+                for player in player_filter.select(players):
                     athlete = player.get("athlete", {})
                     position = player.get("position", {})
                     stats_list = player.get("stats", [])
@@ -252,7 +422,7 @@ def get_boxscore(sport: str, event_id: str):
                         "players": []
                     }
 
-                    for athlete_stat in cat.get("athletes", []):
+                    for athlete_stat in player_filter.select(cat.get("athletes", [])):
                         athlete = athlete_stat.get("athlete", {})
                         stats_values = athlete_stat.get("stats", [])
 
@@ -300,7 +470,7 @@ def get_boxscore(sport: str, event_id: str):
                         "players": []
                     }
 
-                    for athlete_stat in cat.get("athletes", []):
+                    for athlete_stat in player_filter.select(cat.get("athletes", [])):
                         athlete = athlete_stat.get("athlete", {})
                         stats_values = athlete_stat.get("stats", [])
 
@@ -318,7 +488,7 @@ def get_boxscore(sport: str, event_id: str):
                         team_data["categories"].append(category_data)
                 else:
                     # NBA format - single flat list of players with stats as dict
-                    for athlete_stat in cat.get("athletes", []):
+                    for athlete_stat in player_filter.select(cat.get("athletes", [])):
                         athlete = athlete_stat.get("athlete", {})
                         stats_values = athlete_stat.get("stats", [])
 
@@ -346,14 +516,91 @@ def get_boxscore(sport: str, event_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Sports that support play-by-play via game summary
+_SUMMARY_LIVE_SPORTS = ['nba', 'nfl', 'ncaab', 'ncaaf']
+
+
+def _empty_live_result(event_id: str, sport: str) -> dict:
+    return {
+        "event_id": event_id,
+        "sport": sport,
+        "last_play": None,
+        "last_play_team_id": None,
+        "home_team_id": None,
+        "away_team_id": None,
+        "game_state": "unknown",
+        "game_status": "",
+        "home_score": None,
+        "away_score": None,
+        "home_team": None,
+        "away_team": None,
+        "home_logo": None,
+        "away_logo": None,
+        "display_clock": None,
+        "period": None,
+        "home_win_pct": None,
+    }
+
+
+def _apply_live_summary(result: dict, summary: dict):
+    """Fill a pinned game's live data from its game summary (includes last_play)."""
+    result["game_state"] = summary.get("_game_state", "unknown")
+    result["game_status"] = summary.get("_game_status_detail", "")
+    result["last_play"] = summary.get("_last_play")
+    result["last_play_team_id"] = summary.get("_last_play_team_id")
+
+    # Extract live situation data
+    live_situation = summary.get("_live_situation", {})
+    if live_situation:
+        result["display_clock"] = live_situation.get("display_clock")
+        result["period"] = live_situation.get("period")
+        result["home_score"] = live_situation.get("home_score")
+        result["away_score"] = live_situation.get("away_score")
+        result["home_team"] = live_situation.get("home_abbrev")
+        result["away_team"] = live_situation.get("away_abbrev")
+        result["home_logo"] = live_situation.get("home_logo")
+        result["away_logo"] = live_situation.get("away_logo")
+        result["home_win_pct"] = live_situation.get("home_win_pct")
+        result["home_team_id"] = live_situation.get("home_team_id")
+        result["away_team_id"] = live_situation.get("away_team_id")
+
+
+def _apply_live_score(result: dict, matching_score: dict, sport: str):
+    """Fill a pinned game's live data from its scoreboard entry (basic scores only)."""
+    result["game_state"] = matching_score.get("state", "unknown")
+    result["game_status"] = matching_score.get("status", "")
+    result["home_score"] = matching_score.get("home_score")
+    result["away_score"] = matching_score.get("away_score")
+    result["home_team"] = matching_score.get("home_team")
+    result["away_team"] = matching_score.get("away_team")
+    result["home_logo"] = matching_score.get("home_logo")
+    result["away_logo"] = matching_score.get("away_logo")
+    result["display_clock"] = matching_score.get("display_clock")
+    result["period"] = matching_score.get("period")
+    # Tennis-specific fields
+    if sport.startswith('tennis'):
+        result["home_set_scores"] = matching_score.get("home_set_scores")
+        result["away_set_scores"] = matching_score.get("away_set_scores")
+        result["current_game"] = matching_score.get("current_game")
+        result["current_set"] = matching_score.get("current_set")
+        result["last_play"] = matching_score.get("match_note")  # Use match note as "play-by-play"
+
+
 @router.post("/pinned-games-live")
 def get_pinned_games_live(games: List[Dict] = Body(...)):
     """
     Get live data including play-by-play for multiple pinned games.
     Accepts a list of {event_id, sport} objects and returns enriched data.
+
+    Summary-backed sports fetch each game's summary concurrently; other sports
+    fetch their scoreboard once and look games up by event/competition ID.
+    A failed fetch only leaves the affected games with default values.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         results = []
+        summary_games: Dict[tuple, List[dict]] = {}  # {(sport, event_id): [result]}
+        scoreboard_games: Dict[str, List[dict]] = {}  # {sport: [result]}
 
         for game in games:
             event_id = game.get("event_id")
@@ -362,85 +609,45 @@ def get_pinned_games_live(games: List[Dict] = Body(...)):
             if not event_id or not sport:
                 continue
 
-            result = {
-                "event_id": event_id,
-                "sport": sport,
-                "last_play": None,
-                "last_play_team_id": None,
-                "home_team_id": None,
-                "away_team_id": None,
-                "game_state": "unknown",
-                "game_status": "",
-                "home_score": None,
-                "away_score": None,
-                "home_team": None,
-                "away_team": None,
-                "home_logo": None,
-                "away_logo": None,
-                "display_clock": None,
-                "period": None,
-                "home_win_pct": None,
-            }
+            result = _empty_live_result(event_id, sport)
+            results.append(result)
+            if sport in _SUMMARY_LIVE_SPORTS:
+                summary_games.setdefault((sport, str(event_id)), []).append(result)
+            else:
+                scoreboard_games.setdefault(sport, []).append(result)
 
+        def load_summary(sport: str, event_id: str):
             try:
-                # Sports that support play-by-play via game summary
-                supported_sports = ['nba', 'nfl', 'ncaab', 'ncaaf']
-
-                if sport in supported_sports:
-                    # Fetch game summary which includes last_play
-                    summary = sports_fetcher._fetch_game_summary(sport, event_id)
-
-                    result["game_state"] = summary.get("_game_state", "unknown")
-                    result["game_status"] = summary.get("_game_status_detail", "")
-                    result["last_play"] = summary.get("_last_play")
-                    result["last_play_team_id"] = summary.get("_last_play_team_id")
-
-                    # Extract live situation data
-                    live_situation = summary.get("_live_situation", {})
-                    if live_situation:
-                        result["display_clock"] = live_situation.get("display_clock")
-                        result["period"] = live_situation.get("period")
-                        result["home_score"] = live_situation.get("home_score")
-                        result["away_score"] = live_situation.get("away_score")
-                        result["home_team"] = live_situation.get("home_abbrev")
-                        result["away_team"] = live_situation.get("away_abbrev")
-                        result["home_logo"] = live_situation.get("home_logo")
-                        result["away_logo"] = live_situation.get("away_logo")
-                        result["home_win_pct"] = live_situation.get("home_win_pct")
-                        result["home_team_id"] = live_situation.get("home_team_id")
-                        result["away_team_id"] = live_situation.get("away_team_id")
-                else:
-                    # For other sports, just get basic scores
-                    scores = sports_fetcher.fetch_scores(sport, 50, date=None)
-                    matching_score = None
-                    for s in scores:
-                        if s.get("event_id") == event_id or s.get("competition_id") == event_id:
-                            matching_score = s
-                            break
-
-                    if matching_score:
-                        result["game_state"] = matching_score.get("state", "unknown")
-                        result["game_status"] = matching_score.get("status", "")
-                        result["home_score"] = matching_score.get("home_score")
-                        result["away_score"] = matching_score.get("away_score")
-                        result["home_team"] = matching_score.get("home_team")
-                        result["away_team"] = matching_score.get("away_team")
-                        result["home_logo"] = matching_score.get("home_logo")
-                        result["away_logo"] = matching_score.get("away_logo")
-                        result["display_clock"] = matching_score.get("display_clock")
-                        result["period"] = matching_score.get("period")
-                        # Tennis-specific fields
-                        if sport.startswith('tennis'):
-                            result["home_set_scores"] = matching_score.get("home_set_scores")
-                            result["away_set_scores"] = matching_score.get("away_set_scores")
-                            result["current_game"] = matching_score.get("current_game")
-                            result["current_set"] = matching_score.get("current_set")
-                            result["last_play"] = matching_score.get("match_note")  # Use match note as "play-by-play"
-
+                summary = sports_fetcher._fetch_game_summary(sport, event_id)
             except Exception as e:
                 print(f"Error fetching live data for {sport}/{event_id}: {e}")
+                return
+            for result in summary_games[(sport, event_id)]:
+                _apply_live_summary(result, summary)
 
-            results.append(result)
+        def load_scoreboard(sport: str):
+            try:
+                scores = sports_fetcher.fetch_scores(sport, 50, date=None)
+            except Exception as e:
+                print(f"Error fetching live data for {sport} scoreboard: {e}")
+                return
+            by_id = {}
+            for s in scores:
+                for key in (s.get("competition_id"), s.get("event_id")):
+                    if key:
+                        by_id.setdefault(str(key), s)
+            for result in scoreboard_games[sport]:
+                matching_score = by_id.get(str(result["event_id"]))
+                if matching_score:
+                    _apply_live_score(result, matching_score, sport)
+
+        tasks = len(summary_games) + len(scoreboard_games)
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(8, tasks)) as executor:
+                futures = [executor.submit(load_summary, sport, event_id) for sport, event_id in summary_games]
+                futures += [executor.submit(load_scoreboard, sport) for sport in scoreboard_games]
+                for future in futures:
+                    future.result()
 
         return results
     except Exception as e:
@@ -448,11 +655,13 @@ def get_pinned_games_live(games: List[Dict] = Body(...)):
 
 
 @router.get("/validate-player")
+@conditional_response(30)
 def validate_player(sport: str, event_id: str, player_name: str):
     """
     Validate and find a player in a specific game.
     Returns the full player name and team if found.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         result = sports_fetcher.find_player(sport, event_id, player_name)
         if result:
@@ -471,11 +680,13 @@ def validate_player(sport: str, event_id: str, player_name: str):
 
 
 @router.get("/search-players")
+@conditional_response(30)
 def search_players(sport: str, event_id: str, query: str, limit: int = Query(10, ge=1, le=50)):
     """
     Search for players in a game matching a query.
     Returns a list of matching players with their display names and team names.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
         results = sports_fetcher.search_players(sport, event_id, query, limit)
         return [
@@ -1,32 +1,90 @@
+import re
 import time
+import threading
+import unicodedata
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from fastapi import APIRouter, HTTPException, Query, Body, Depends
 from briefing.supabase_service import supabase_service
-from briefing.sports_fetcher import SportsFetcher
+from briefing.sports_fetcher import get_sports_fetcher
+from briefing.background import run_in_background, run_periodically
+from briefing import cache_snapshot
+from briefing.cache import TieredCache
 from .auth import get_current_user
+from .response_cache import conditional_response
 from .models import FavoriteTeam, FavoriteTeamRequest
 
 router = APIRouter(tags=["teams"])
 
-sports_fetcher = SportsFetcher()
-
-# In-memory cache for teams data (refreshes every 24 hours)
-_teams_cache: Dict[str, Dict] = {}  # {sport: {'data': [...], 'timestamp': float}}
+# Cache for teams data (refreshes every 24 hours)
 _TEAMS_CACHE_TTL = 86400  # 24 hours in seconds
-
-
-def _get_cached_teams(sport_key: str, sport_display: str) -> list:
-    """Get teams from cache or fetch from ESPN if stale/missing."""
+_teams_cache = TieredCache('teams', _TEAMS_CACHE_TTL)  # {sport: {'data': [...], 'timestamp': float}}
+_TEAMS_REFRESH_AHEAD_AGE = 72000  # refetch after 20 hours, before the TTL expires
+_TEAMS_REFRESH_CHECK_INTERVAL = 60  # seconds between refresh-ahead checks
+
+# Team search index, rebuilt whenever _teams_cache refreshes
+# {'teams': [...], 'starts': {prefix: [team_idx]}, 'tokens': {prefix: [team_idx]},
+#  'versions': {sport: timestamp of the cache entry it was built from}}
+_teams_index: Dict[str, object] = {'teams': [], 'starts': {}, 'tokens': {}, 'versions': {}}
+_teams_index_lock = threading.Lock()
+_TEAMS_INDEX_MAX_PREFIX = 20
+_SEARCH_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Favorite team results caches
+_SCHEDULE_CACHE_TTL = 300  # 5 minutes in seconds
+_schedule_cache = TieredCache('team_schedules', _SCHEDULE_CACHE_TTL)  # {'schedule_path:team_id': {'data': {...}, 'timestamp': float}}
+_SCOREBOARD_CACHE_TTL = 300  # 5 minutes in seconds
+_scoreboard_cache = TieredCache('scoreboards', _SCOREBOARD_CACHE_TTL)  # {'schedule_path:YYYYMMDD': {'data': [...], 'timestamp': float}}
+_TEAM_LOGO_CACHE_TTL = 86400  # 24 hours in seconds
+_team_logo_cache = TieredCache('team_logos', _TEAM_LOGO_CACHE_TTL, max_entries=2048)  # {'schedule_path:team_id': {'data': logo_url, 'timestamp': float}}
+
+# Display names for team-based sports/leagues
+_SPORT_DISPLAY_NAMES = {
+    'nfl': 'NFL',
+    'nba': 'NBA',
+    'mlb': 'MLB',
+    'nhl': 'NHL',
+    'epl': 'Premier League',
+    'laliga': 'La Liga',
+    'ucl': 'Champions League',
+    'seriea': 'Serie A',
+    'bundesliga': 'Bundesliga',
+    'mls': 'MLS',
+    'ncaaf': 'College Football',
+    'ncaab': 'College Basketball',
+    'ligue1': 'Ligue 1',
+    'ligaportugal': 'Liga Portugal',
+    'saudi': 'Saudi Pro League',
+    'brasileirao': 'Brasileirao',
+    'ligamx': 'Liga MX',
+}
+
+# Sports to search through (team-based sports only)
+_TEAM_SPORTS = [
+    ('nfl', 'NFL'),
+    ('nba', 'NBA'),
+    ('mlb', 'MLB'),
+    ('nhl', 'NHL'),
+    ('epl', 'Premier League'),
+    ('laliga', 'La Liga'),
+    ('ucl', 'Champions League'),
+    ('seriea', 'Serie A'),
+    ('bundesliga', 'Bundesliga'),
+    ('mls', 'MLS'),
+    ('ncaaf', 'College Football'),
+    ('ncaab', 'College Basketball'),
+    ('ligue1', 'Ligue 1'),
+]
+_TEAM_SEARCH_SPORTS = {sport_key for sport_key, _ in _TEAM_SPORTS}
+
+
+def _fetch_teams(sport_key: str, sport_display: str, rebuild_index: bool = True) -> list:
+    """Fetch teams for one sport from ESPN and store them in _teams_cache."""
+    sports_fetcher = get_sports_fetcher()
     cache_entry = _teams_cache.get(sport_key)
     now = time.time()
 
-    # Return cached data if fresh
-    if cache_entry and (now - cache_entry['timestamp']) < _TEAMS_CACHE_TTL:
-        return cache_entry['data']
-
-    # Fetch fresh data
     try:
         sport_path = sports_fetcher.SPORTS.get(sport_key)
         if not sport_path:
@@ -36,6 +94,7 @@ def _get_cached_teams(sport_key: str, sport_display: str) -> list:
         response = sports_fetcher.session.get(url, timeout=5)
 
         if response.status_code != 200:
+            print(f"Error fetching teams for {sport_key}: HTTP {response.status_code}")
             # Return stale cache if available, otherwise empty
             return cache_entry['data'] if cache_entry else []
 
@@ -60,6 +119,8 @@ def _get_cached_teams(sport_key: str, sport_display: str) -> list:
             })
 
         _teams_cache[sport_key] = {'data': teams, 'timestamp': now}
+        if rebuild_index and sport_key in _TEAM_SEARCH_SPORTS:
+            _rebuild_teams_index()
         return teams
 
     except Exception as e:
@@ -68,81 +129,197 @@ def _get_cached_teams(sport_key: str, sport_display: str) -> list:
         return cache_entry['data'] if cache_entry else []
 
 
+def _get_cached_teams(sport_key: str, sport_display: str) -> list:
+    """
+    Get teams from cache without blocking on ESPN.
+    Stale or missing entries are refreshed in the background; stale data is
+    served meanwhile and a cold sport returns [] until its first fetch lands.
+    """
+    cache_entry = _teams_cache.get(sport_key)
+
+    if not cache_entry or (time.time() - cache_entry['timestamp']) >= _TEAMS_CACHE_TTL:
+        run_in_background(f"teams-refresh-{sport_key}", lambda: _fetch_teams(sport_key, sport_display))
+
+    return cache_entry['data'] if cache_entry else []
+
+
+def _normalize_search_text(text: str) -> str:
+    """Lowercase, strip accents and collapse punctuation/whitespace to single spaces."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return ' '.join(_SEARCH_TOKEN_RE.findall(text))
+
+
+def _rebuild_teams_index():
+    """
+    Rebuild the team search index from _teams_cache.
+    The new index is swapped in with one assignment, so readers never see a partial build.
+
+    Teams are numbered in alphabetical order, so every posting list is already
+    sorted by name. Relevance ranks are precomputed by map:
+      - 'starts': prefixes of the full name or abbreviation (rank 0)
+      - 'tokens': prefixes of any word in the name, nickname or abbreviation (rank 1)
+    """
+    global _teams_index
+
+    with _teams_index_lock:
+        _teams_index = _build_teams_index()
+
+
+def _cached_team_versions() -> Dict[str, float]:
+    """{sport: timestamp} of the searchable sports' current _teams_cache entries (L1 or shared L2)."""
+    versions = {}
+    for sport_key, _ in _TEAM_SPORTS:
+        cache_entry = _teams_cache.get(sport_key)
+        if cache_entry:
+            versions[sport_key] = cache_entry['timestamp']
+    return versions
+
+
+def _ensure_teams_index():
+    """
+    Rebuild the search index if it doesn't match _teams_cache, e.g. when another
+    worker filled the shared cache tier and this process never fetched itself.
+    """
+    if not _teams_index['teams'] or _teams_index['versions'] != _cached_team_versions():
+        _rebuild_teams_index()
+
+
+def _build_teams_index() -> Dict[str, object]:
+    teams = []
+    versions = {}
+    for sport_key, _ in _TEAM_SPORTS:
+        cache_entry = _teams_cache.get(sport_key)
+        if cache_entry:
+            teams.extend(cache_entry['data'])
+            versions[sport_key] = cache_entry['timestamp']
+    teams.sort(key=lambda t: (t['name'].lower(), t['sport']))
+
+    starts: Dict[str, List[int]] = {}
+    tokens: Dict[str, List[int]] = {}
+
+    for idx, team in enumerate(teams):
+        name = _normalize_search_text(team['name'])
+        abbreviation = _normalize_search_text(team['abbreviation'])
+        nickname = _normalize_search_text(team.get('nickname', ''))
+
+        start_prefixes = set()
+        for text in (name, abbreviation):
+            for end in range(1, min(len(text), _TEAMS_INDEX_MAX_PREFIX) + 1):
+                start_prefixes.add(text[:end])
+
+        token_prefixes = set()
+        for word in set(f"{name} {nickname} {abbreviation}".split()):
+            for end in range(1, min(len(word), _TEAMS_INDEX_MAX_PREFIX) + 1):
+                token_prefixes.add(word[:end])
+
+        for prefix in start_prefixes:
+            starts.setdefault(prefix, []).append(idx)
+        for prefix in token_prefixes:
+            tokens.setdefault(prefix, []).append(idx)
+
+    results = [{
+        'id': team['id'],
+        'name': team['name'],
+        'abbreviation': team['abbreviation'],
+        'logo': team['logo'],
+        'sport': team['sport'],
+        'sportDisplay': team['sportDisplay'],
+    } for team in teams]
+
+    return {'teams': results, 'starts': starts, 'tokens': tokens, 'versions': versions}
+
+
+def _search_teams_index(query: str, limit: int) -> list:
+    """Look up teams by name/abbreviation prefix first, then by word prefixes."""
+    index = _teams_index
+    normalized = _normalize_search_text(query)
+    if not normalized:
+        return []
+
+    matches = list(index['starts'].get(normalized[:_TEAMS_INDEX_MAX_PREFIX], []))
+    if len(normalized) > _TEAMS_INDEX_MAX_PREFIX:
+        matches = [i for i in matches if _normalize_search_text(index['teams'][i]['name']).startswith(normalized)]
+
+    if len(matches) < limit:
+        # Every query word must prefix some word of the team (e.g. "man u" -> "Manchester United")
+        word_matches = None
+        for word in normalized.split():
+            postings = set(index['tokens'].get(word[:_TEAMS_INDEX_MAX_PREFIX], []))
+            word_matches = postings if word_matches is None else word_matches & postings
+            if not word_matches:
+                break
+        seen = set(matches)
+        matches.extend(sorted(i for i in (word_matches or ()) if i not in seen))
+
+    return [index['teams'][i] for i in matches[:limit]]
+
+
+def _refresh_teams_catalog(max_age: float = _TEAMS_REFRESH_AHEAD_AGE):
+    """
+    Fetch every sport's teams that are missing or older than max_age in parallel,
+    then rebuild the search index once.
+    """
+    now = time.time()
+    due = [
+        (sport_key, sport_display)
+        for sport_key, sport_display in _SPORT_DISPLAY_NAMES.items()
+        if not _teams_cache.get(sport_key) or (now - _teams_cache[sport_key]['timestamp']) >= max_age
+    ]
+    if not due:
+        # Nothing to fetch, but the catalog may have arrived through the shared cache tier
+        _ensure_teams_index()
+        return
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {executor.submit(_fetch_teams, key, display, False): key for key, display in due}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error in parallel team fetch for {futures[future]}: {e}")
+
+    _rebuild_teams_index()
+
+    missing = [key for key, _ in due if not _teams_cache.get(key) or _teams_cache[key]['timestamp'] < now]
+    print(f"[Teams] Refreshed {len(due) - len(missing)}/{len(due)} team catalogs in {time.perf_counter() - start:.1f}s"
+          + (f" (will retry: {', '.join(missing)})" if missing else ""))
+
+
+def start_teams_catalog_refresher():
+    """
+    Preload the teams catalog in the background and keep it warm.
+    Each sport is refetched once it is older than _TEAMS_REFRESH_AHEAD_AGE, well
+    before the 24h TTL, so requests never see an expired catalog; sports that
+    failed to load are retried on the next check.
+    """
+    run_periodically('teams-catalog', _TEAMS_REFRESH_CHECK_INTERVAL, _refresh_teams_catalog)
+
+
+# Restored catalogs skip the refetch until they reach _TEAMS_REFRESH_AHEAD_AGE
+cache_snapshot.register('teams', _teams_cache, _TEAMS_CACHE_TTL, on_load=_rebuild_teams_index)
+
+
+def _search_max_age(results: list) -> int:
+    # Results from an index still missing some sports must not be reused by browsers or the CDN
+    return 3600 if _TEAM_SEARCH_SPORTS <= _teams_index['versions'].keys() else 0
+
+
 @router.get("/api/teams/search")
+@conditional_response(_search_max_age, stale_while_revalidate=86400)
 def search_teams(query: str = Query(..., min_length=2), limit: int = Query(10, ge=1, le=50)):
     """
     Search for teams across all supported sports.
     Returns matching teams with their ID, name, abbreviation, logo, and sport.
-    Uses cached team data for fast responses.
+    Served from the prebuilt team search index, which the background refresher keeps warm.
     """
     try:
-        results = []
-        query_lower = query.lower().strip()
-
-        # Sports to search through (team-based sports only)
-        team_sports = [
-            ('nfl', 'NFL'),
-            ('nba', 'NBA'),
-            ('mlb', 'MLB'),
-            ('nhl', 'NHL'),
-            ('epl', 'Premier League'),
-            ('laliga', 'La Liga'),
-            ('ucl', 'Champions League'),
-            ('seriea', 'Serie A'),
-            ('bundesliga', 'Bundesliga'),
-            ('mls', 'MLS'),
-            ('ncaaf', 'College Football'),
-            ('ncaab', 'College Basketball'),
-            ('ligue1', 'Ligue 1'),
-        ]
-
-        # Fetch teams from all sports in parallel (uses cache when available)
-        def fetch_sport(sport_tuple):
-            sport_key, sport_display = sport_tuple
-            return _get_cached_teams(sport_key, sport_display)
-
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            futures = {executor.submit(fetch_sport, s): s for s in team_sports}
-            all_teams = []
-            for future in as_completed(futures, timeout=10):
-                try:
-                    teams = future.result()
-                    all_teams.extend(teams)
-                except Exception as e:
-                    print(f"Error in parallel team fetch: {e}")
-
-        # Search through all teams
-        for team in all_teams:
-            name = team.get('name', '')
-            abbreviation = team.get('abbreviation', '')
-            nickname = team.get('nickname', '')
-
-            if (query_lower in name.lower() or
-                query_lower in abbreviation.lower() or
-                query_lower in nickname.lower()):
-
-                results.append({
-                    'id': team['id'],
-                    'name': name,
-                    'abbreviation': abbreviation,
-                    'logo': team['logo'],
-                    'sport': team['sport'],
-                    'sportDisplay': team['sportDisplay'],
-                })
-
-                if len(results) >= limit * 2:  # Get extra for sorting
-                    break
-
-        # Sort results by relevance (starts with > contains)
-        def relevance(team):
-            name_lower = team['name'].lower()
-            abbrev_lower = team['abbreviation'].lower()
-            if name_lower.startswith(query_lower) or abbrev_lower.startswith(query_lower):
-                return 0
-            return 1
-
-        results.sort(key=relevance)
-        return results[:limit]
+        if not _teams_index['teams']:
+            _ensure_teams_index()
+            start_teams_catalog_refresher()
+
+        return _search_teams_index(query, limit)
 
     except Exception as e:
         print(f"Error searching teams: {e}")
@@ -150,36 +327,17 @@ def search_teams(query: str = Query(..., min_length=2), limit: int = Query(10, g
 
 
 @router.get("/api/teams/by-sport/{sport}")
+@conditional_response(3600, stale_while_revalidate=86400)
 def get_teams_by_sport(sport: str):
     """
     Get all teams for a specific sport/league.
     Returns teams sorted alphabetically by name.
     Uses cached team data for fast responses.
     """
+    sports_fetcher = get_sports_fetcher()
     try:
-        # Map sport key to display name
-        sport_display_map = {
-            'nfl': 'NFL',
-            'nba': 'NBA',
-            'mlb': 'MLB',
-            'nhl': 'NHL',
-            'epl': 'Premier League',
-            'laliga': 'La Liga',
-            'ucl': 'Champions League',
-            'seriea': 'Serie A',
-            'bundesliga': 'Bundesliga',
-            'mls': 'MLS',
-            'ncaaf': 'College Football',
-            'ncaab': 'College Basketball',
-            'ligue1': 'Ligue 1',
-            'ligaportugal': 'Liga Portugal',
-            'saudi': 'Saudi Pro League',
-            'brasileirao': 'Brasileirao',
-            'ligamx': 'Liga MX',
-        }
-
         sport_lower = sport.lower()
-        sport_display = sport_display_map.get(sport_lower, sport.upper())
+        sport_display = _SPORT_DISPLAY_NAMES.get(sport_lower, sport.upper())
 
         sport_path = sports_fetcher.SPORTS.get(sport_lower)
         if not sport_path:
@@ -189,7 +347,8 @@ def get_teams_by_sport(sport: str):
         teams = _get_cached_teams(sport_lower, sport_display)
 
         if not teams:
-            raise HTTPException(status_code=500, detail="Failed to fetch teams")
+            # Cold catalog: a background fetch was just scheduled
+            raise HTTPException(status_code=503, detail="Teams are still loading, please try again shortly")
 
         # Format results (cache already has parsed data)
         results = [{
@@ -212,223 +371,330 @@ def get_teams_by_sport(sport: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/api/teams/favorites/results")
-def get_favorite_teams_results(teams: List[FavoriteTeam] = Body(...)):
+def _schedule_path(sport_path: str) -> str:
     """
-    Get latest results and next game for favorite teams.
-    Returns last completed game result and next scheduled game for each team.
+    Path used for team schedules and scoreboards.
+    For soccer teams, use 'soccer/all' to get all competitions (league, cups, etc.)
+    This ensures we show Champions League, FA Cup, etc. games for favorite teams
     """
+    return 'soccer/all' if sport_path.startswith('soccer/') else sport_path
+
+
+def _get_cached_team_schedule(schedule_path: str, team_id: str) -> Optional[Dict]:
+    """Get a team's schedule (past and future games) from cache or ESPN."""
+    sports_fetcher = get_sports_fetcher()
+    cache_key = f"{schedule_path}:{team_id}"
+    cache_entry = _schedule_cache.get(cache_key)
+    now = time.time()
+
+    if cache_entry and (now - cache_entry['timestamp']) < _SCHEDULE_CACHE_TTL:
+        return cache_entry['data']
+
+    try:
+        url = f"{sports_fetcher.BASE_URL}/{schedule_path}/teams/{team_id}/schedule"
+        response = sports_fetcher.session.get(url, timeout=10)
+        if response.status_code != 200:
+            return cache_entry['data'] if cache_entry else None
+
+        data = response.json()
+        _schedule_cache[cache_key] = {'data': data, 'timestamp': now}
+        return data
+    except Exception as e:
+        print(f"Error fetching schedule for team {team_id}: {e}")
+        return cache_entry['data'] if cache_entry else None
+
+
+def _get_cached_scoreboard_events(schedule_path: str, date_str: str) -> list:
+    """Get scoreboard events for one (league, date), shared by every favorite in that league."""
+    sports_fetcher = get_sports_fetcher()
+    cache_key = f"{schedule_path}:{date_str}"
+    cache_entry = _scoreboard_cache.get(cache_key)
+    now = time.time()
+
+    if cache_entry and (now - cache_entry['timestamp']) < _SCOREBOARD_CACHE_TTL:
+        return cache_entry['data']
+
     try:
-        results = []
-
-        for team in teams:
-            team_result = {
-                'team_id': team.id,
-                'team_name': team.name,
-                'sport': team.sport,
-                'last_game': None,
-                'next_game': None,
-                'logo': None,
-            }
+        url = f"{sports_fetcher.BASE_URL}/{schedule_path}/scoreboard?dates={date_str}"
+        response = sports_fetcher.session.get(url, timeout=5)
+        if response.status_code != 200:
+            return cache_entry['data'] if cache_entry else []
 
+        events = response.json().get('events', [])
+        _scoreboard_cache[cache_key] = {'data': events, 'timestamp': now}
+        return events
+    except Exception as e:
+        print(f"Error fetching {schedule_path} scoreboard for {date_str}: {e}")
+        return cache_entry['data'] if cache_entry else []
+
+
+def _get_team_logos(sport_key: str) -> Dict[str, str]:
+    """
+    Map team ID -> logo URL from the cached teams catalog.
+    Soccer schedules span competitions, so every cached soccer league is included.
+    """
+    sports_fetcher = get_sports_fetcher()
+    _get_cached_teams(sport_key, _SPORT_DISPLAY_NAMES.get(sport_key, sport_key.upper()))
+
+    is_soccer = sports_fetcher.SPORTS.get(sport_key, '').startswith('soccer/')
+    logos = {}
+    for cached_sport, cache_entry in list(_teams_cache.items()):
+        if cached_sport != sport_key and not (is_soccer and sports_fetcher.SPORTS.get(cached_sport, '').startswith('soccer/')):
+            continue
+        for team in cache_entry['data']:
+            if team['logo']:
+                logos.setdefault(str(team['id']), team['logo'])
+    return logos
+
+
+def _get_cached_team_logo(schedule_path: str, team_id: str) -> str:
+    """Last-resort logo lookup for teams outside the catalog (e.g. cup opponents from other leagues)."""
+    sports_fetcher = get_sports_fetcher()
+    cache_key = f"{schedule_path}:{team_id}"
+    cache_entry = _team_logo_cache.get(cache_key)
+    if cache_entry and (time.time() - cache_entry['timestamp']) < _TEAM_LOGO_CACHE_TTL:
+        return cache_entry['data']
+
+    logo_url = ''
+    try:
+        team_url = f"{sports_fetcher.BASE_URL}/{schedule_path}/teams/{team_id}"
+        team_response = sports_fetcher.session.get(team_url, timeout=5)
+        if team_response.status_code == 200:
+            team_logos = team_response.json().get('team', {}).get('logos', [])
+            if team_logos:
+                logo_url = team_logos[0].get('href', '')
+    except Exception:
+        return ''
+
+    _team_logo_cache[cache_key] = {'data': logo_url, 'timestamp': time.time()}
+    return logo_url
+
+
+def _find_team_in_competition(comp: Dict, team_id: str):
+    """Return (our_team, opponent, is_home) for a competition, or (None, None, False)."""
+    our_team = None
+    opponent = None
+    is_home = False
+
+    for c in comp.get('competitors', []):
+        c_team = c.get('team', {})
+        if str(c_team.get('id', '')) == str(team_id):
+            our_team = c
+            is_home = c.get('homeAway', 'away') == 'home'
+        else:
+            opponent = c
+
+    return our_team, opponent, is_home
+
+
+def _load_team_schedule_result(team: FavoriteTeam, now: datetime) -> Dict:
+    """Build a favorite team's result (last and next game) from its schedule."""
+    sports_fetcher = get_sports_fetcher()
+    team_result = {
+        'team_id': team.id,
+        'team_name': team.name,
+        'sport': team.sport,
+        'last_game': None,
+        'next_game': None,
+        'logo': None,
+    }
+
+    sport_path = sports_fetcher.SPORTS.get(team.sport.lower())
+    if not sport_path:
+        return team_result
+
+    # Fetch team schedule (includes past and future games)
+    data = _get_cached_team_schedule(_schedule_path(sport_path), team.id)
+    if not data:
+        return team_result
+
+    # Get team info (including logo)
+    team_info = data.get('team', {})
+    logos = team_info.get('logos', [])
+    team_result['logo'] = logos[0].get('href', '') if logos else None
+    team_result['team_name'] = team_info.get('displayName', team.name)
+
+    completed_games = []
+    upcoming_games = []
+
+    for event in data.get('events', []):
+        competitions = event.get('competitions', [])
+        if not competitions:
+            continue
+
+        comp = competitions[0]
+        status = comp.get('status', {}).get('type', {})
+        state = status.get('state', 'pre')
+
+        # Parse event date
+        event_date_str = event.get('date', '')
+        try:
+            event_date = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
+        except:
+            continue
+
+        if len(comp.get('competitors', [])) < 2:
+            continue
+
+        # Determine which competitor is our team
+        our_team, opponent, is_home = _find_team_in_competition(comp, team.id)
+        if not our_team or not opponent:
+            continue
+
+        opponent_team = opponent.get('team', {})
+        opponent_logos = opponent_team.get('logos', [])
+
+        game_data = {
+            'event_id': event.get('id', ''),
+            'date': event_date_str,
+            'opponent_name': opponent_team.get('displayName', 'Unknown'),
+            'opponent_abbreviation': opponent_team.get('abbreviation', ''),
+            'opponent_logo': opponent_logos[0].get('href', '') if opponent_logos else '',
+            'is_home': is_home,
+            'our_score': our_team.get('score', {}).get('displayValue', '0') if isinstance(our_team.get('score'), dict) else our_team.get('score', '0'),
+            'opponent_score': opponent.get('score', {}).get('displayValue', '0') if isinstance(opponent.get('score'), dict) else opponent.get('score', '0'),
+            'status': status.get('description', ''),
+            'state': state,
+        }
+
+        # Determine if it was a win/loss
+        if state == 'post':
             try:
-                sport_path = sports_fetcher.SPORTS.get(team.sport.lower())
-                if not sport_path:
-                    results.append(team_result)
-                    continue
+                our_score = int(game_data['our_score']) if game_data['our_score'] else 0
+                opp_score = int(game_data['opponent_score']) if game_data['opponent_score'] else 0
+                game_data['result'] = 'W' if our_score > opp_score else ('L' if our_score < opp_score else 'T')
+            except:
+                game_data['result'] = None
+            completed_games.append((event_date, game_data))
+        elif state == 'pre':
+            upcoming_games.append((event_date, game_data))
+
+    # Get most recent completed game
+    if completed_games:
+        completed_games.sort(key=lambda x: x[0], reverse=True)
+        team_result['last_game'] = completed_games[0][1]
 
-                # For soccer teams, use 'soccer/all' to get all competitions (league, cups, etc.)
-                # This ensures we show Champions League, FA Cup, etc. games for favorite teams
-                if sport_path.startswith('soccer/'):
-                    schedule_path = 'soccer/all'
-                else:
-                    schedule_path = sport_path
+    # Get next upcoming game
+    if upcoming_games:
+        upcoming_games.sort(key=lambda x: x[0])
+        team_result['next_game'] = upcoming_games[0][1]
 
-                # Fetch team schedule (includes past and future games)
-                url = f"{sports_fetcher.BASE_URL}/{schedule_path}/teams/{team.id}/schedule"
-                response = sports_fetcher.session.get(url, timeout=10)
+    return team_result
 
-                if response.status_code != 200:
-                    results.append(team_result)
+
+def _find_next_games_on_scoreboards(schedule_path: str, pending: List[tuple], now: datetime):
+    """
+    Search the league scoreboard for the next 14 days for teams without an upcoming game.
+    This is needed because some leagues (especially soccer) don't include future fixtures in schedule.
+    Each (league, date) scoreboard is fetched once and checked for every pending team.
+    """
+    remaining = list(pending)
+    logos_by_sport: Dict[str, Dict[str, str]] = {}
+
+    for days_ahead in range(1, 15):
+        if not remaining:
+            break
+
+        date_str = (now + timedelta(days=days_ahead)).strftime('%Y%m%d')
+        scoreboard_events = _get_cached_scoreboard_events(schedule_path, date_str)
+        if not scoreboard_events:
+            continue
+
+        still_remaining = []
+        for team, team_result in remaining:
+            for event in scoreboard_events:
+                competitions = event.get('competitions', [])
+                if not competitions:
                     continue
 
-                data = response.json()
+                comp = competitions[0]
+                our_team_comp, opponent_comp, is_home = _find_team_in_competition(comp, team.id)
+                if not our_team_comp or not opponent_comp:
+                    continue
 
-                # Get team info (including logo)
-                team_info = data.get('team', {})
-                logos = team_info.get('logos', [])
-                team_result['logo'] = logos[0].get('href', '') if logos else None
-                team_result['team_name'] = team_info.get('displayName', team.name)
+                status = comp.get('status', {}).get('type', {})
+                state = status.get('state', 'pre')
 
-                events = data.get('events', [])
+                # Only consider pre-game or scheduled games
+                if state not in ('pre', 'scheduled'):
+                    continue
 
-                # Find most recent completed game and next upcoming game
-                now = datetime.now(timezone.utc)
+                opponent_team = opponent_comp.get('team', {})
+                opponent_logos = opponent_team.get('logos', [])
+                opponent_logo_url = opponent_logos[0].get('href', '') if opponent_logos else ''
 
-                completed_games = []
-                upcoming_games = []
+                # If no logo in scoreboard, resolve it from the cached teams catalog
+                opponent_id = str(opponent_team.get('id', ''))
+                if not opponent_logo_url and opponent_id:
+                    sport_key = team.sport.lower()
+                    if sport_key not in logos_by_sport:
+                        logos_by_sport[sport_key] = _get_team_logos(sport_key)
+                    opponent_logo_url = logos_by_sport[sport_key].get(opponent_id) or _get_cached_team_logo(schedule_path, opponent_id)
 
-                for event in events:
-                    competitions = event.get('competitions', [])
-                    if not competitions:
-                        continue
+                team_result['next_game'] = {
+                    'event_id': event.get('id', ''),
+                    'date': event.get('date', ''),
+                    'opponent_name': opponent_team.get('displayName', 'Unknown'),
+                    'opponent_abbreviation': opponent_team.get('abbreviation', ''),
+                    'opponent_logo': opponent_logo_url,
+                    'is_home': is_home,
+                    'status': status.get('description', ''),
+                    'state': state,
+                }
+                break
 
-                    comp = competitions[0]
-                    status = comp.get('status', {}).get('type', {})
-                    state = status.get('state', 'pre')
+            if not team_result['next_game']:
+                still_remaining.append((team, team_result))
 
-                    # Parse event date
-                    event_date_str = event.get('date', '')
-                    try:
-                        event_date = datetime.fromisoformat(event_date_str.replace('Z', '+00:00'))
-                    except:
-                        continue
-
-                    competitors = comp.get('competitors', [])
-                    if len(competitors) < 2:
-                        continue
-
-                    # Determine which competitor is our team
-                    our_team = None
-                    opponent = None
-                    is_home = False
-
-                    for c in competitors:
-                        c_team = c.get('team', {})
-                        if str(c_team.get('id', '')) == str(team.id):
-                            our_team = c
-                            is_home = c.get('homeAway', 'away') == 'home'
-                        else:
-                            opponent = c
-
-                    if not our_team or not opponent:
-                        continue
-
-                    opponent_team = opponent.get('team', {})
-                    opponent_logos = opponent_team.get('logos', [])
-
-                    game_data = {
-                        'event_id': event.get('id', ''),
-                        'date': event_date_str,
-                        'opponent_name': opponent_team.get('displayName', 'Unknown'),
-                        'opponent_abbreviation': opponent_team.get('abbreviation', ''),
-                        'opponent_logo': opponent_logos[0].get('href', '') if opponent_logos else '',
-                        'is_home': is_home,
-                        'our_score': our_team.get('score', {}).get('displayValue', '0') if isinstance(our_team.get('score'), dict) else our_team.get('score', '0'),
-                        'opponent_score': opponent.get('score', {}).get('displayValue', '0') if isinstance(opponent.get('score'), dict) else opponent.get('score', '0'),
-                        'status': status.get('description', ''),
-                        'state': state,
-                    }
-
-                    # Determine if it was a win/loss
-                    if state == 'post':
-                        try:
-                            our_score = int(game_data['our_score']) if game_data['our_score'] else 0
-                            opp_score = int(game_data['opponent_score']) if game_data['opponent_score'] else 0
-                            game_data['result'] = 'W' if our_score > opp_score else ('L' if our_score < opp_score else 'T')
-                        except:
-                            game_data['result'] = None
-                        completed_games.append((event_date, game_data))
-                    elif state == 'pre':
-                        upcoming_games.append((event_date, game_data))
-
-                # Get most recent completed game
-                if completed_games:
-                    completed_games.sort(key=lambda x: x[0], reverse=True)
-                    team_result['last_game'] = completed_games[0][1]
-
-                # Get next upcoming game
-                if upcoming_games:
-                    upcoming_games.sort(key=lambda x: x[0])
-                    team_result['next_game'] = upcoming_games[0][1]
-
-                # If no upcoming games found in schedule, search scoreboard for next 14 days
-                # This is needed because some leagues (especially soccer) don't include future fixtures in schedule
-                if not team_result['next_game']:
-                    for days_ahead in range(1, 15):
-                        future_date = now + timedelta(days=days_ahead)
-                        date_str = future_date.strftime('%Y%m%d')
-
-                        try:
-                            scoreboard_url = f"{sports_fetcher.BASE_URL}/{schedule_path}/scoreboard?dates={date_str}"
-                            scoreboard_response = sports_fetcher.session.get(scoreboard_url, timeout=5)
-
-                            if scoreboard_response.status_code != 200:
-                                continue
-
-                            scoreboard_data = scoreboard_response.json()
-                            scoreboard_events = scoreboard_data.get('events', [])
-
-                            for event in scoreboard_events:
-                                competitions = event.get('competitions', [])
-                                if not competitions:
-                                    continue
-
-                                comp = competitions[0]
-                                competitors = comp.get('competitors', [])
-
-                                # Check if our team is in this game
-                                our_team_comp = None
-                                opponent_comp = None
-                                is_home = False
-
-                                for c in competitors:
-                                    c_team = c.get('team', {})
-                                    if str(c_team.get('id', '')) == str(team.id):
-                                        our_team_comp = c
-                                        is_home = c.get('homeAway', 'away') == 'home'
-                                    else:
-                                        opponent_comp = c
-
-                                if our_team_comp and opponent_comp:
-                                    status = comp.get('status', {}).get('type', {})
-                                    state = status.get('state', 'pre')
-
-                                    # Only consider pre-game or scheduled games
-                                    if state in ('pre', 'scheduled'):
-                                        opponent_team = opponent_comp.get('team', {})
-                                        opponent_logos = opponent_team.get('logos', [])
-                                        opponent_logo_url = opponent_logos[0].get('href', '') if opponent_logos else ''
-
-                                        # If no logo in scoreboard, fetch from team endpoint
-                                        if not opponent_logo_url:
-                                            opponent_id = opponent_team.get('id', '')
-                                            if opponent_id:
-                                                try:
-                                                    team_url = f"{sports_fetcher.BASE_URL}/{schedule_path}/teams/{opponent_id}"
-                                                    team_response = sports_fetcher.session.get(team_url, timeout=5)
-                                                    if team_response.status_code == 200:
-                                                        team_data = team_response.json()
-                                                        team_logos = team_data.get('team', {}).get('logos', [])
-                                                        if team_logos:
-                                                            opponent_logo_url = team_logos[0].get('href', '')
-                                                except:
-                                                    pass
-
-                                        team_result['next_game'] = {
-                                            'event_id': event.get('id', ''),
-                                            'date': event.get('date', ''),
-                                            'opponent_name': opponent_team.get('displayName', 'Unknown'),
-                                            'opponent_abbreviation': opponent_team.get('abbreviation', ''),
-                                            'opponent_logo': opponent_logo_url,
-                                            'is_home': is_home,
-                                            'status': status.get('description', ''),
-                                            'state': state,
-                                        }
-                                        break
-
-                            # If we found a game, stop searching
-                            if team_result['next_game']:
-                                break
-
-                        except Exception as scoreboard_err:
-                            # Continue to next day on error
-                            continue
+        remaining = still_remaining
 
+
+@router.post("/api/teams/favorites/results")
+def get_favorite_teams_results(teams: List[FavoriteTeam] = Body(...)):
+    """
+    Get latest results and next game for favorite teams.
+    Returns last completed game result and next scheduled game for each team.
+    Team schedules are fetched concurrently; scoreboard lookahead is shared per league.
+    """
+    sports_fetcher = get_sports_fetcher()
+    try:
+        now = datetime.now(timezone.utc)
+
+        def load_result(team: FavoriteTeam) -> Dict:
+            try:
+                return _load_team_schedule_result(team, now)
             except Exception as e:
                 print(f"Error fetching results for team {team.id}: {e}")
-
-            results.append(team_result)
+                return {
+                    'team_id': team.id,
+                    'team_name': team.name,
+                    'sport': team.sport,
+                    'last_game': None,
+                    'next_game': None,
+                    'logo': None,
+                }
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(load_result, teams))
+
+        # Group teams still missing a next game by league so they share scoreboard fetches
+        lookahead: Dict[str, List[tuple]] = {}
+        for team, team_result in zip(teams, results):
+            sport_path = sports_fetcher.SPORTS.get(team.sport.lower())
+            if sport_path and not team_result['next_game']:
+                lookahead.setdefault(_schedule_path(sport_path), []).append((team, team_result))
+
+        if lookahead:
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                futures = [
+                    executor.submit(_find_next_games_on_scoreboards, path, pending, now)
+                    for path, pending in lookahead.items()
+                ]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Error searching scoreboards for next games: {e}")
 
         return results
 
@@ -442,6 +708,7 @@ def get_favorite_teams_results(teams: List[FavoriteTeam] = Body(...)):
 # ==========================================
 
 @router.get("/api/favorite-teams")
+@conditional_response(private=True)
 def get_favorite_teams(user_id: str = Depends(get_current_user)):
     """Get user's favorite teams from the database"""
     try:
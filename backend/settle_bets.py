@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Settle pending bets whose games are final.
+
+Usage:
+    python settle_bets.py            # apply Won/Lost/Pushed
+    python settle_bets.py --dry-run  # only report what would be settled
+"""
+import argparse
+
+from briefing.settlement import settle_pending_bets
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Settle pending bets whose games are final')
+    parser.add_argument('--dry-run', action='store_true', help='Report outcomes without updating any bets')
+    args = parser.parse_args()
+
+    summary = settle_pending_bets(dry_run=args.dry_run)
+
+    for status, bets in summary['settled'].items():
+        for bet in bets:
+            print(f"{status:7} {bet['id']}  {bet['type']:<12} {bet['matchup']} - {bet['selection']}")
+
+    settled_count = sum(len(bets) for bets in summary['settled'].values())
+    action = 'Would settle' if summary['dry_run'] else 'Settled'
+    print(f"\n{action} {settled_count} bets, {summary['pending']} still pending "
+          f"({summary['events_fetched']} events fetched)")
+
+
+if __name__ == '__main__':
+    main()
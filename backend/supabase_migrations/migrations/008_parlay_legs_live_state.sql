@@ -0,0 +1,20 @@
+-- ============================================================================
+-- Migration: Add live tracking state to parlay_legs table
+-- Final values of a leg are stored once its game is over, so refreshes can
+-- skip settled legs instead of re-fetching their game summaries
+-- ============================================================================
+
+-- Add live tracking columns to parlay_legs table (same as on bets)
+ALTER TABLE parlay_legs
+ADD COLUMN IF NOT EXISTS current_value NUMERIC(10,2),
+ADD COLUMN IF NOT EXISTS current_value_str TEXT,
+ADD COLUMN IF NOT EXISTS game_state TEXT CHECK (game_state IN ('pre', 'in', 'post')),
+ADD COLUMN IF NOT EXISTS game_status_text TEXT,
+ADD COLUMN IF NOT EXISTS prop_status TEXT;
+
+-- Comment on columns for documentation
+COMMENT ON COLUMN parlay_legs.current_value IS 'Last known stat value for the leg';
+COMMENT ON COLUMN parlay_legs.current_value_str IS 'Display string for the current value';
+COMMENT ON COLUMN parlay_legs.game_state IS 'Game state of the leg (pre, in, post)';
+COMMENT ON COLUMN parlay_legs.game_status_text IS 'Game status for display (e.g. "Final")';
+COMMENT ON COLUMN parlay_legs.prop_status IS 'Leg outcome (pending, live_hit, live_miss, won, lost, push)';
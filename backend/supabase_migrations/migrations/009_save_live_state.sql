@@ -0,0 +1,55 @@
+-- ============================================================================
+-- Migration: Batched write-back of live tracking fields
+-- The API stores the live state computed on each refresh (current value,
+-- game state, prop status) for all refreshed bets and parlay legs in one call
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.save_live_state(p_user_id UUID, p_bets JSONB, p_legs JSONB)
+RETURNS VOID AS $$
+BEGIN
+    -- Only rows whose values actually changed are rewritten
+    UPDATE bets b
+    SET current_value = r.current_value,
+        current_value_str = r.current_value_str,
+        game_state = r.game_state,
+        game_status_text = r.game_status_text,
+        prop_status = r.prop_status
+    FROM jsonb_to_recordset(COALESCE(p_bets, '[]'::jsonb)) AS r(
+        id UUID,
+        current_value NUMERIC,
+        current_value_str TEXT,
+        game_state TEXT,
+        game_status_text TEXT,
+        prop_status TEXT
+    )
+    WHERE b.id = r.id
+    AND b.user_id = p_user_id
+    AND (b.current_value, b.current_value_str, b.game_state, b.game_status_text, b.prop_status)
+        IS DISTINCT FROM (r.current_value, r.current_value_str, r.game_state, r.game_status_text, r.prop_status);
+
+    UPDATE parlay_legs l
+    SET current_value = r.current_value,
+        current_value_str = r.current_value_str,
+        game_state = r.game_state,
+        game_status_text = r.game_status_text,
+        prop_status = r.prop_status,
+        combined_players = COALESCE(r.combined_players, l.combined_players)
+    FROM jsonb_to_recordset(COALESCE(p_legs, '[]'::jsonb)) AS r(
+        id UUID,
+        current_value NUMERIC,
+        current_value_str TEXT,
+        game_state TEXT,
+        game_status_text TEXT,
+        prop_status TEXT,
+        combined_players JSONB
+    ), bets b
+    WHERE l.id = r.id
+    AND b.id = l.bet_id
+    AND b.user_id = p_user_id
+    AND (l.current_value, l.current_value_str, l.game_state, l.game_status_text, l.prop_status)
+        IS DISTINCT FROM (r.current_value, r.current_value_str, r.game_state, r.game_status_text, r.prop_status);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Takes the user ID as a parameter, so only the backend (service role) may call it
+REVOKE EXECUTE ON FUNCTION public.save_live_state(UUID, JSONB, JSONB) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,25 @@
+from routes.sports import _PlayerFilter
+
+
+def _entries(*athletes):
+    return [{'athlete': {'id': athlete_id, 'displayName': name}} for athlete_id, name in athletes]
+
+
+ENTRIES = _entries(('1966', 'LeBron James'), ('4066261', 'Austin Reaves'), ('3945274', 'Luka Doncic'))
+
+
+def test_single_numeric_id_is_an_id_not_a_count():
+    selected = _PlayerFilter('4066261').select(ENTRIES)
+
+    assert [entry['athlete']['id'] for entry in selected] == ['4066261']
+
+
+def test_ids_and_names():
+    selected = _PlayerFilter('1966, luka doncic').select(ENTRIES)
+
+    assert [entry['athlete']['displayName'] for entry in selected] == ['LeBron James', 'Luka Doncic']
+
+
+def test_top_keeps_first_players():
+    assert len(_PlayerFilter(top=2).select(ENTRIES)) == 2
+    assert _PlayerFilter().select(ENTRIES) == ENTRIES
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from briefing import cache
+from briefing.cache import SQLiteBackend
+from routes import teams
+
+
+def _catalog(sport_key, sport_display, now):
+    return {
+        'data': [{
+            'id': f'{sport_key}-1',
+            'name': f'Los Angeles {sport_display} Club',
+            'abbreviation': sport_key[:3].upper(),
+            'nickname': 'Club',
+            'logo': '',
+            'sport': sport_key,
+            'sportDisplay': sport_display,
+        }],
+        'timestamp': now,
+    }
+
+
+@pytest.fixture
+def warm_shared_catalog(tmp_path, monkeypatch):
+    """Another worker filled the shared SQLite tier; this process has an empty L1 and index."""
+    monkeypatch.setattr(cache, '_shared_backend', SQLiteBackend(tmp_path / 'cache.sqlite3'))
+    monkeypatch.setattr(cache, '_shared_backend_loaded', True)
+    monkeypatch.setattr(cache, '_shared_retry_at', 0.0)
+    monkeypatch.setattr(teams, 'start_teams_catalog_refresher', lambda: None)
+
+    now = time.time()
+    for sport_key, sport_display in teams._SPORT_DISPLAY_NAMES.items():
+        teams._teams_cache[sport_key] = _catalog(sport_key, sport_display, now)
+    teams._teams_cache.clear()
+    monkeypatch.setattr(teams, '_teams_index', {'teams': [], 'starts': {}, 'tokens': {}, 'versions': {}})
+    yield
+    teams._teams_cache.clear()
+
+
+def test_search_uses_catalog_from_shared_tier(warm_shared_catalog):
+    results = teams.search_teams(query='los angeles', limit=50)
+
+    assert {team['sport'] for team in results} == teams._TEAM_SEARCH_SPORTS
+
+
+def test_refresh_rebuilds_index_when_nothing_is_due(warm_shared_catalog, monkeypatch):
+    monkeypatch.setattr(teams, '_fetch_teams', lambda *args: pytest.fail('fresh catalog was refetched'))
+
+    teams._refresh_teams_catalog()
+
+    assert len(teams._teams_index['teams']) == len(teams._TEAM_SPORTS)
+    assert teams._search_teams_index('nba', 5)[0]['sport'] == 'nba'
+
+
+def test_partial_index_is_not_cacheable(warm_shared_catalog):
+    teams._rebuild_teams_index()
+    assert teams._search_max_age([]) == 3600
+
+    teams._teams_cache.pop('nhl')
+    teams._rebuild_teams_index()
+    assert teams._search_max_age([]) == 0